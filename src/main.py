@@ -1,12 +1,15 @@
 """Main application entry point for CPU monitoring TUI."""
 
 import asyncio
+import copy
+import functools
 import getpass
 import logging
+import os
 import sys
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import NotRequired, TypedDict
+from typing import IO, NotRequired, TypedDict
 
 import asyncssh
 import yaml
@@ -14,6 +17,7 @@ import yaml
 from .monitor import CPUMonitor
 from .ssh_client import ServerConfig, SSHClient
 from .ui import MonitoringApp, ServerWidget
+from .validation import validate_server_config
 
 
 class ServerConfigDict(TypedDict):
@@ -67,15 +71,98 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed C implementations when PyYAML was built with them
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Deepest nesting of mappings/lists accepted in a config file (the schema itself needs 3)
+_MAX_CONFIG_DEPTH = 8
+
+
+def _check_config_depth(config: object) -> None:
+    """Reject configs whose mappings and lists nest deeper than _MAX_CONFIG_DEPTH.
+
+    YAML aliases let a small file describe an exponentially large or even
+    recursive structure; both exceed the limit, so they are rejected before
+    anything walks or copies the whole tree. Containers shared through aliases
+    are only re-checked when reached at a deeper level than before.
+
+    Args:
+        config: Parsed configuration
+
+    Raises:
+        yaml.YAMLError: If the nesting limit is exceeded
+    """
+    checked: dict[int, int] = {}  # id(container) -> deepest level it was checked at
+    stack: list[tuple[object, int]] = [(config, 1)]
+    while stack:
+        value, depth = stack.pop()
+        if isinstance(value, dict):
+            children = value.values()
+        elif isinstance(value, list):
+            children = value
+        else:
+            continue
+
+        if depth > _MAX_CONFIG_DEPTH:
+            raise yaml.YAMLError(f"Configuration nested deeper than {_MAX_CONFIG_DEPTH} levels")
+        if checked.get(id(value), 0) >= depth:
+            continue
+        checked[id(value)] = depth
+        stack.extend((child, depth + 1) for child in children)
+
+
+def _parse_config_document(document: bytes | IO[str]) -> AppConfigDict:
+    """Parse a YAML config from raw bytes or an open text stream.
+
+    Args:
+        document: Raw file contents (decoded by the YAML reader itself), or a
+            stream positioned at the start of the document
+
+    Returns:
+        Parsed configuration
+
+    Raises:
+        yaml.YAMLError: If the document is not valid YAML or nests too deeply
+    """
+    config = yaml.load(document, Loader=_YAML_LOADER)
+    _check_config_depth(config)
+    return config
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_config_file(path: str, _mtime_ns: int, _size: int) -> AppConfigDict:
+    """Parse a YAML config file, memoized on its path, modification time and size.
+
+    The stat fields are only part of the cache key: any write to the file
+    changes them and forces a fresh parse. Callers must deep-copy the result
+    before mutating it, since the cached object is shared.
+
+    Args:
+        path: Absolute path to the configuration file
+        _mtime_ns: File modification time in nanoseconds
+        _size: File size in bytes
+
+    Returns:
+        Parsed configuration
+
+    Raises:
+        yaml.YAMLError: If the file is not valid YAML or nests too deeply
+    """
+    # Hand libyaml the raw bytes: it detects the encoding and decodes in C,
+    # skipping the TextIOWrapper layer a text-mode open() would add
+    return _parse_config_document(Path(path).read_bytes())
+
 
 class CPUMonitoringApp:
     """Main application coordinating SSH, monitoring, and UI."""
 
-    def __init__(self, config_path: str = "config.yaml"):
+    def __init__(self, config_path: str | os.PathLike[str] | IO[str] = "config.yaml"):
         """Initialize the monitoring application.
 
         Args:
-            config_path: Path to configuration file
+            config_path: Path to configuration file, or an open text stream to
+                read it from (streams are read-only: save_config skips them)
         """
         self.config_path = config_path
         self.config: AppConfigDict = {"servers": [], "monitoring": {}, "display": {}}
@@ -88,35 +175,97 @@ class CPUMonitoringApp:
         self._running = False
         logger.info(f"CPUMonitoringApp initialized with config_path: {config_path}")
 
-    def load_config(self):
-        """Load configuration from YAML file."""
-        config_file = Path(self.config_path)
+    def _read_config(self) -> AppConfigDict:
+        """Parse the configuration from config_path without validating it.
+
+        Returns:
+            A parsed configuration the caller may freely mutate
 
-        logger.info(f"Loading configuration from: {config_file.absolute()}")
+        Raises:
+            yaml.YAMLError: If the document is not valid YAML or nests too deeply
+            OSError: If the file cannot be read
+        """
+        source = self.config_path
+        if not isinstance(source, str | os.PathLike):
+            logger.info("Loading configuration from stream")
+            # Streams are consumed by reading, so there is nothing to cache
+            return _parse_config_document(source)
+
+        config_file = Path(source)
+        config_path = config_file.absolute()
+        logger.info(f"Loading configuration from: {config_path}")
 
-        if not config_file.exists():
+        # The stat doubles as the existence check and the parse cache key
+        try:
+            stat = config_file.stat()
+        except FileNotFoundError:
             logger.error(f"Configuration file not found: {config_file}")
             sys.exit(1)
 
-        try:
-            with open(config_file) as f:
-                self.config = yaml.safe_load(f)
+        parsed = _parse_config_file(str(config_path), stat.st_mtime_ns, stat.st_size)
+        # Copy so edits to self.config (add/delete server) never reach the cache
+        return copy.deepcopy(parsed)
 
-            logger.info(f"Configuration loaded successfully from {config_file}")
+    @classmethod
+    def from_dict(
+        cls, config: AppConfigDict, config_path: str | os.PathLike[str] = "config.yaml"
+    ) -> "CPUMonitoringApp":
+        """Create an app from an already-parsed configuration.
 
-            # Validate required sections
-            if "servers" not in self.config:
-                logger.error("Configuration missing 'servers' section")
-                sys.exit(1)
+        The configuration is validated exactly as load_config would validate a file.
+
+        Args:
+            config: Configuration mapping, as load_config would have parsed it
+            config_path: Where save_config writes the configuration to
+
+        Returns:
+            An app holding its own copy of config
+        """
+        app = cls(config_path=config_path)
+        # Copy so add/delete server never edits the caller's dict
+        app.config = copy.deepcopy(config)
+        logger.info("Configuration loaded from dict")
+        app._validate_config()
+        return app
+
+    def _validate_config(self):
+        """Validate self.config, exiting if it cannot be monitored."""
+        # Validate required sections
+        if not isinstance(self.config, dict):
+            logger.error("Configuration must be a mapping")
+            sys.exit(1)
+
+        if "servers" not in self.config:
+            logger.error("Configuration missing 'servers' section")
+            sys.exit(1)
+
+        if not self.config["servers"]:
+            logger.error("No servers configured")
+            sys.exit(1)
 
-            if not self.config["servers"]:
-                logger.error("No servers configured")
+        if not isinstance(self.config["servers"], list):
+            logger.error("Configuration 'servers' section must be a list")
+            sys.exit(1)
+
+        # Reject malformed entries now rather than part-way through initialize_components
+        for i, server in enumerate(self.config["servers"], 1):
+            result = validate_server_config(server)
+            if not result.valid:
+                logger.error(f"Invalid configuration for server {i}: {result.error_message}")
                 sys.exit(1)
 
-            server_count = len(self.config["servers"])
-            logger.info(f"Configuration validated: {server_count} server(s) found")
-            for i, server in enumerate(self.config["servers"], 1):
-                logger.info(f"  Server {i}: {server.get('name', 'unnamed')} ({server.get('host', 'no-host')})")
+        server_count = len(self.config["servers"])
+        logger.info(f"Configuration validated: {server_count} server(s) found")
+        for i, server in enumerate(self.config["servers"], 1):
+            logger.info(f"  Server {i}: {server.get('name', 'unnamed')} ({server.get('host', 'no-host')})")
+
+    def load_config(self):
+        """Load and validate configuration from the YAML file or stream given as config_path."""
+        try:
+            self.config = self._read_config()
+
+            logger.info("Configuration loaded successfully")
+            self._validate_config()
 
         except yaml.YAMLError as e:
             logger.error(f"Error parsing configuration file: {e}")
@@ -195,30 +344,15 @@ class CPUMonitoringApp:
 
                 logger.info(f"Creating components for server: {srv_config.name} ({srv_config.host})")
 
-                # Create SSH client
-                ssh_client = SSHClient(
-                    config=srv_config,
+                self._build_server_components(
+                    srv_config,
+                    poll_interval=poll_interval,
+                    history_window=history_window,
                     connection_timeout=connection_timeout,
                     max_retries=max_retries,
                     retry_delay=retry_delay,
-                )
-                self.ssh_clients.append(ssh_client)
-                logger.info(f"  SSHClient created for {srv_config.name}")
-
-                # Create CPU monitor
-                monitor = CPUMonitor(ssh_client=ssh_client, poll_interval=poll_interval, history_window=history_window)
-                self.monitors.append(monitor)
-                logger.info(f"  CPUMonitor created for {srv_config.name}")
-
-                # Create UI widget
-                widget = ServerWidget(
-                    server_name=srv_config.name,
-                    history_window=history_window,
                     plot_style=plot_style,
-                    poll_interval=poll_interval,
                 )
-                self.server_widgets.append(widget)
-                logger.info(f"  ServerWidget created for {srv_config.name}")
 
                 logger.info(f"All components initialized successfully for server: {srv_config.name}")
 
@@ -231,6 +365,58 @@ class CPUMonitoringApp:
 
         logger.info(f"Component initialization complete: {len(self.ssh_clients)} servers configured")
 
+    def _build_server_components(
+        self,
+        srv_config: ServerConfig,
+        *,
+        poll_interval: float,
+        history_window: int,
+        connection_timeout: int,
+        max_retries: int,
+        retry_delay: int,
+        plot_style: str,
+    ) -> tuple[SSHClient, CPUMonitor, ServerWidget]:
+        """Create and register the SSH client, monitor, and widget for one server.
+
+        Components are appended to ssh_clients, monitors, and server_widgets, so
+        index i in each list always refers to the same server.
+
+        Args:
+            srv_config: Validated server configuration
+            poll_interval: Seconds between metric polls
+            history_window: Seconds of CPU history to keep
+            connection_timeout: SSH connection timeout in seconds
+            max_retries: Maximum number of connection retry attempts
+            retry_delay: Delay between retry attempts in seconds
+            plot_style: History plot style for the widget
+
+        Returns:
+            The new (ssh_client, monitor, widget) triple
+        """
+        ssh_client = SSHClient(
+            config=srv_config,
+            connection_timeout=connection_timeout,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+        )
+        self.ssh_clients.append(ssh_client)
+        logger.info(f"  SSHClient created for {srv_config.name}")
+
+        monitor = CPUMonitor(ssh_client=ssh_client, poll_interval=poll_interval, history_window=history_window)
+        self.monitors.append(monitor)
+        logger.info(f"  CPUMonitor created for {srv_config.name}")
+
+        widget = ServerWidget(
+            server_name=srv_config.name,
+            history_window=history_window,
+            plot_style=plot_style,
+            poll_interval=poll_interval,
+        )
+        self.server_widgets.append(widget)
+        logger.info(f"  ServerWidget created for {srv_config.name}")
+
+        return ssh_client, monitor, widget
+
     async def start_monitoring(self):
         """Start all monitoring tasks."""
         logger.info(f"Starting monitoring for {len(self.ssh_clients)} servers in background...")
@@ -280,10 +466,14 @@ class CPUMonitoringApp:
 
     def save_config(self):
         """Save current configuration to YAML file."""
+        if not isinstance(self.config_path, str | os.PathLike):
+            logger.warning("Configuration was loaded from a stream, not saving")
+            return
+
         logger.info(f"Saving configuration to: {self.config_path}")
         try:
             with open(self.config_path, "w") as f:
-                yaml.dump(self.config, f, default_flow_style=False, sort_keys=False)
+                yaml.dump(self.config, f, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False)
             logger.info(f"Configuration saved successfully to {self.config_path}")
             logger.info(f"  Current server count: {len(self.config.get('servers', []))}")
         except (OSError, yaml.YAMLError) as e:
@@ -390,27 +580,15 @@ class CPUMonitoringApp:
             verify_host_key=server_config.get("verify_host_key", False),
         )
 
-        ssh_client = SSHClient(
-            config=srv_config,
+        ssh_client, monitor, widget = self._build_server_components(
+            srv_config,
+            poll_interval=poll_interval,
+            history_window=history_window,
             connection_timeout=connection_timeout,
             max_retries=max_retries,
             retry_delay=retry_delay,
-        )
-        self.ssh_clients.append(ssh_client)
-        logger.info(f"  SSHClient created for {server_name}")
-
-        monitor = CPUMonitor(ssh_client=ssh_client, poll_interval=poll_interval, history_window=history_window)
-        self.monitors.append(monitor)
-        logger.info(f"  CPUMonitor created for {server_name}")
-
-        widget = ServerWidget(
-            server_name=srv_config.name,
-            history_window=history_window,
             plot_style=plot_style,
-            poll_interval=poll_interval,
         )
-        self.server_widgets.append(widget)
-        logger.info(f"  ServerWidget created for {server_name}")
 
         # Add widget to UI
         if self.ui_app:
@@ -456,9 +634,9 @@ class CPUMonitoringApp:
                         widget.refresh_display()
 
                     # Update history data
-                    history_data = await monitor.get_cpu_history()
-                    if history_data:
-                        widget.update_history(history_data)
+                    timestamps, usages = await monitor.get_cpu_history_columns()
+                    if timestamps:
+                        widget.update_history_columns(timestamps, usages)
 
                 # Update status bar timestamp
                 if self.ui_app:
@@ -3,7 +3,8 @@
 import asyncio
 import logging
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from itertools import compress
 
 import asyncssh
 
@@ -13,7 +14,7 @@ from .ssh_client import SSHClient
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class CPUCore:
     """CPU core information."""
 
@@ -24,7 +25,7 @@ class CPUCore:
     idle: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryInfo:
     """Memory information."""
 
@@ -35,9 +36,17 @@ class MemoryInfo:
     usage_percent: float
     cached_mb: float = 0.0
     buffers_mb: float = 0.0
+    # Derived once per reading for display and logging
+    used_gb: float = field(init=False, repr=False, compare=False)
+    total_gb: float = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        """Derive the GB figures from the MB readings."""
+        self.used_gb = self.used_mb / 1024.0
+        self.total_gb = self.total_mb / 1024.0
 
-@dataclass
+
+@dataclass(slots=True)
 class ServerMetrics:
     """CPU metrics for a server."""
 
@@ -78,8 +87,9 @@ class CPUMonitor:
         # For CPU usage calculation
         self._prev_stats: dict[int, dict[str, int]] | None = None
 
-        # CPU history: list of (timestamp, overall_usage) tuples
-        self._cpu_history: list[tuple[float, float]] = []
+        # CPU history as parallel columns: timestamps and overall usage per sample
+        self._cpu_timestamps: list[float] = []
+        self._cpu_usages: list[float] = []
 
         logger.info(f"CPUMonitor initialized for server '{ssh_client.config.name}': poll_interval={poll_interval}s, history_window={history_window}s")
 
@@ -127,7 +137,49 @@ class CPUMonitor:
             List of (timestamp, overall_usage) tuples
         """
         async with self._lock:
-            return self._cpu_history.copy()
+            return list(zip(self._cpu_timestamps, self._cpu_usages, strict=True))
+
+    async def get_cpu_history_columns(self) -> tuple[list[float], list[float]]:
+        """Get CPU usage history as parallel columns.
+
+        Cheaper than get_cpu_history() for consumers that read the columns
+        separately, as no per-sample tuples are built.
+
+        Returns:
+            Tuple of (timestamps, overall_usages) lists of equal length
+        """
+        async with self._lock:
+            return self._cpu_timestamps.copy(), self._cpu_usages.copy()
+
+    def _record_history(self, timestamp: float, usage: float) -> int:
+        """Append a sample to the history and trim samples outside the window.
+
+        Must be called with the lock held.
+
+        Args:
+            timestamp: Sample time
+            usage: Overall CPU usage percentage
+
+        Returns:
+            Number of samples trimmed
+        """
+        self._cpu_timestamps.append(timestamp)
+        self._cpu_usages.append(usage)
+
+        # Trim history to keep only data within the window. Filtering by timestamp
+        # (rather than dropping a prefix) also handles clock skew.
+        cutoff_time = timestamp - self.history_window
+        keep = list(map(cutoff_time.__le__, self._cpu_timestamps))
+        if all(keep):
+            return 0
+        before_trim = len(keep)
+        self._cpu_timestamps = list(compress(self._cpu_timestamps, keep))
+        self._cpu_usages = list(compress(self._cpu_usages, keep))
+        # If clock skew cleared all history, keep at least the current entry
+        if not self._cpu_timestamps:
+            self._cpu_timestamps = [timestamp]
+            self._cpu_usages = [usage]
+        return before_trim - len(self._cpu_timestamps)
 
     async def _monitor_loop(self):
         """Main monitoring loop that periodically collects CPU data."""
@@ -176,22 +228,11 @@ class CPUMonitor:
 
                     # Add to history if connected
                     if metrics.connected:
-                        current_time = time.time()
-                        self._cpu_history.append((current_time, metrics.overall_usage))
-
-                        # Trim history to keep only data within the window
-                        # Use max() to handle clock skew - keep at least last entry
-                        cutoff_time = current_time - self.history_window
-                        before_trim = len(self._cpu_history)
-                        self._cpu_history = [(t, u) for t, u in self._cpu_history if t >= cutoff_time]
-                        # If clock skew cleared all history, keep at least the current entry
-                        if not self._cpu_history:
-                            self._cpu_history = [(current_time, metrics.overall_usage)]
-                        after_trim = len(self._cpu_history)
+                        trimmed = self._record_history(time.time(), metrics.overall_usage)
 
                         if loop_count % 20 == 0:  # Log every 20 loops to avoid spam
                             logger.info(f"{self.ssh_client.config.name}: Metrics collected: cores={len(metrics.cores)}, "
-                                      f"overall_usage={metrics.overall_usage:.1f}%, history_points={after_trim} (trimmed {before_trim-after_trim})")
+                                      f"overall_usage={metrics.overall_usage:.1f}%, history_points={len(self._cpu_timestamps)} (trimmed {trimmed})")
 
             except asyncio.CancelledError:
                 logger.info(f"{self.ssh_client.config.name}: Monitor loop cancelled")
@@ -246,7 +287,10 @@ class CPUMonitor:
                 logger.info(f"{self.ssh_client.config.name}: Parsing memory info from /proc/meminfo...")
                 memory_info = self._parse_meminfo(mem_output)
                 if memory_info:
-                    logger.info(f"{self.ssh_client.config.name}: Memory parsed: {memory_info.usage_percent:.1f}% used ({memory_info.used_mb/1024:.1f}GB/{memory_info.total_mb/1024:.1f}GB)")
+                    logger.info(
+                        "%s: Memory parsed: %.1f%% used (%.1fGB/%.1fGB)",
+                        self.ssh_client.config.name, memory_info.usage_percent, memory_info.used_gb, memory_info.total_gb,
+                    )
             else:
                 logger.warning(f"{self.ssh_client.config.name}: Failed to read memory info")
                 memory_info = None
@@ -61,6 +61,7 @@ class MonitoringApp(App[None]):
         self._on_delete_server = on_delete_server
         self._on_add_server = on_add_server
         self._last_metrics_update: float | None = None
+        self._spinner_frame = 0
         logger.info(f"MonitoringApp initialized with {len(server_widgets)} server widgets")
 
     def compose(self) -> ComposeResult:
@@ -80,6 +81,15 @@ class MonitoringApp(App[None]):
         logger.info("MonitoringApp mounted, initializing UI state")
         self._update_selection()
         self._update_status_bar()
+        # One shared spinner timer (0.1s interval for smooth animation) instead of one per server
+        self._spinner_timer = self.set_interval(0.1, self._animate_spinners)
+
+    def _animate_spinners(self) -> None:
+        """Advance the shared spinner frame on every server that is not connected."""
+        self._spinner_frame = (self._spinner_frame + 1) % len(ServerWidget.SPINNER_FRAMES)
+        for widget in self.server_widgets:
+            if widget.is_spinning:
+                widget.set_spinner_frame(self._spinner_frame)
 
     def action_navigate_up(self):
         """Navigate to previous server."""
@@ -8,6 +8,7 @@ from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.screen import ModalScreen
+from textual.widget import Widget
 from textual.widgets import Button, Input, Label, OptionList
 from textual.widgets.option_list import Option
 
@@ -15,10 +16,22 @@ from ..types import FieldDefinition
 from ...validation import validate_hostname, validate_server_name, validate_username
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from textual.timer import Timer
+
     from ...main import ServerConfigDict
 
 logger = logging.getLogger(__name__)
 
+# Basic text fields composed in order:
+# (container_id, label_id, input_id, placeholder, initial value, help_id)
+_INPUT_SPECS: tuple[tuple[str, str, str, str, str, str], ...] = (
+    ("field-name", "label-name", "input-name", "e.g., Production Server 1", "", "help-name"),
+    ("field-host", "label-host", "input-host", "e.g., 192.168.1.100 or server.example.com", "", "help-host"),
+    ("field-username", "label-username", "input-username", "e.g., ubuntu, admin, root", "ubuntu", "help-username"),
+)
+
 
 class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
     """Modal screen for adding a new server with arrow key navigation."""
@@ -45,24 +58,54 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
         "label-password": "Password:",
     }
 
+    # Highlighted label texts, prefixed with the navigation (→) or edit (▶) arrow
+    _NAV_LABELS: dict[str, str] = {k: f"→ {v}" for k, v in LABEL_TEXTS.items()}
+    _EDIT_LABELS: dict[str, str] = {k: f"▶ {v}" for k, v in LABEL_TEXTS.items()}
+
+    # Class-level constant for help texts under live-validated fields
+    HELP_TEXTS: dict[str, str] = {
+        "help-name": "A friendly name to identify this server",
+        "help-host": "The IP address or hostname of the server",
+        "help-username": "SSH username for authentication",
+    }
+
+    # Validated fields, checked live while typing and again on submit:
+    # (input ID, help label ID, message when empty, validator, fallback error)
+    _VALIDATORS = (
+        ("input-name", "help-name", "Server name is required", validate_server_name, "Invalid server name"),
+        ("input-host", "help-host", "Host (IP or hostname) is required", validate_hostname, "Invalid host"),
+        ("input-username", "help-username", "Username is required", validate_username, "Invalid username"),
+    )
+
+    # Seconds of typing inactivity before live validation runs
+    VALIDATION_DEBOUNCE = 0.2
+
     # Class-level constant for field definitions
-    FIELD_DEFINITIONS: list[FieldDefinition] = [
-        {"id": "input-name", "label_id": "label-name", "type": "input"},
-        {"id": "input-host", "label_id": "label-host", "type": "input"},
-        {"id": "input-username", "label_id": "label-username", "type": "input"},
-        {"id": "auth-method-list", "label_id": "label-authmethod", "type": "optionlist"},
-        {"id": "input-keypath", "label_id": "label-keypath", "type": "input", "auth_type": "key"},
-        {"id": "input-password", "label_id": "label-password", "type": "input", "auth_type": "password"},
-        {"id": "add-btn", "label_id": None, "type": "button"},
-        {"id": "cancel-btn", "label_id": None, "type": "button"},
-    ]
+    FIELD_DEFINITIONS: tuple[FieldDefinition, ...] = (
+        FieldDefinition("input-name", "label-name", "input"),
+        FieldDefinition("input-host", "label-host", "input"),
+        FieldDefinition("input-username", "label-username", "input"),
+        FieldDefinition("auth-method-list", "label-authmethod", "optionlist"),
+        FieldDefinition("input-keypath", "label-keypath", "input", "key"),
+        FieldDefinition("input-password", "label-password", "input", "password"),
+        FieldDefinition("add-btn", None, "button"),
+        FieldDefinition("cancel-btn", None, "button"),
+    )
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.auth_method = "key"  # Default authentication method
-        self.fields: list[FieldDefinition] = []  # List of field definitions
+        self.fields: Sequence[FieldDefinition] = []  # Field definitions, in navigation order
         self.current_field_index = 0
         self.in_edit_mode = False
+        self._highlight_state: tuple[str | None, bool] | None = None  # (field id, edit mode) last drawn
+        self._validate_timer: Timer | None = None  # Pending debounced validation
+        self._password_container: Vertical | None = None  # Mounted on first switch to password auth
+        # Button id -> handler, so presses dispatch with one dict lookup
+        self._btn_handlers: dict[str, Callable[[], object]] = {
+            "add-btn": self._submit,
+            "cancel-btn": lambda: self.dismiss(None),
+        }
         logger.info("AddServerScreen initialized with two-level navigation")
 
     def compose(self) -> ComposeResult:
@@ -70,23 +113,14 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
             yield Label("Add New Server", id="add-title")
 
             with VerticalScroll(id="fields-scroll", can_focus=False):
-                # Server Name Field
-                with Vertical(classes="field-container", id="field-name"):
-                    yield Label("Server Name:", classes="field-label", id="label-name")
-                    yield Input(placeholder="e.g., Production Server 1", id="input-name", disabled=True)
-                    yield Label("A friendly name to identify this server", classes="help-text")
-
-                # Host Field
-                with Vertical(classes="field-container", id="field-host"):
-                    yield Label("Host (IP or Hostname):", classes="field-label", id="label-host")
-                    yield Input(placeholder="e.g., 192.168.1.100 or server.example.com", id="input-host", disabled=True)
-                    yield Label("The IP address or hostname of the server", classes="help-text")
-
-                # Username Field
-                with Vertical(classes="field-container", id="field-username"):
-                    yield Label("Username:", classes="field-label", id="label-username")
-                    yield Input(placeholder="e.g., ubuntu, admin, root", id="input-username", value="ubuntu", disabled=True)
-                    yield Label("SSH username for authentication", classes="help-text")
+                # Server Name, Host and Username Fields
+                label_texts = self.LABEL_TEXTS
+                help_texts = self.HELP_TEXTS
+                for container_id, label_id, input_id, placeholder, value, help_id in _INPUT_SPECS:
+                    with Vertical(classes="field-container", id=container_id):
+                        yield Label(label_texts[label_id], classes="field-label", id=label_id)
+                        yield Input(placeholder=placeholder, id=input_id, value=value, disabled=True)
+                        yield Label(help_texts[help_id], classes="help-text", id=help_id)
 
                 # Authentication Method Selection
                 with Vertical(classes="field-container", id="field-authmethod"):
@@ -106,11 +140,7 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
                     yield Input(placeholder="e.g., ~/.ssh/id_rsa", id="input-keypath", value="~/.ssh/id_rsa", disabled=True)
                     yield Label("Path to your private SSH key file", classes="help-text")
 
-                # Password Field (hidden by default, shown for password auth)
-                with Vertical(classes="field-container hidden", id="password-container"):
-                    yield Label("Password:", classes="field-label", id="label-password")
-                    yield Input(placeholder="Enter password", id="input-password", password=True, disabled=True)
-                    yield Label("SSH password for authentication", classes="help-text")
+                # Password Field is mounted on demand by _mount_password_container
 
             # Action Buttons
             with Horizontal(id="add-buttons"):
@@ -132,7 +162,11 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
             "label-username": self.query_one("#label-username", Label),
             "label-authmethod": self.query_one("#label-authmethod", Label),
             "label-keypath": self.query_one("#label-keypath", Label),
-            "label-password": self.query_one("#label-password", Label),
+        }
+        self._help_labels: dict[str, Label] = {
+            "help-name": self.query_one("#help-name", Label),
+            "help-host": self.query_one("#help-host", Label),
+            "help-username": self.query_one("#help-username", Label),
         }
         self._buttons: dict[str, Button] = {
             "add-btn": self.query_one("#add-btn", Button),
@@ -143,14 +177,13 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
             "input-host": self.query_one("#input-host", Input),
             "input-username": self.query_one("#input-username", Input),
             "input-keypath": self.query_one("#input-keypath", Input),
-            "input-password": self.query_one("#input-password", Input),
         }
         self._auth_list: OptionList = self.query_one("#auth-method-list", OptionList)
         self._key_container = self.query_one("#key-container")
-        self._password_container = self.query_one("#password-container")
+        self._fields_scroll: VerticalScroll = self.query_one("#fields-scroll", VerticalScroll)
 
-        # Use class-level field definitions
-        self.fields = list(self.FIELD_DEFINITIONS)
+        # Use class-level field definitions directly; they are immutable, so no copy is needed
+        self.fields = self.FIELD_DEFINITIONS
 
         # Select the first auth method (SSH Key) by default
         self._auth_list.highlighted = 0
@@ -164,6 +197,21 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
 
     def _update_field_highlights(self) -> None:
         """Update visual indicators to show which field is highlighted."""
+        # Get current field
+        field = self._get_current_field()
+
+        # Skip if this field shouldn't be shown based on auth method
+        if field and field.auth_type is not None and field.auth_type != self.auth_method:
+            # Move to next valid field
+            self._navigate_to_next_valid_field()
+            return
+
+        # Nothing to redraw if the same field is already highlighted in the same mode
+        highlight_state = (field.id if field else None, self.in_edit_mode)
+        if highlight_state == self._highlight_state:
+            return
+        self._highlight_state = highlight_state
+
         # Use cached references if available, fall back to query_one
         labels = getattr(self, "_labels", None)
         buttons = getattr(self, "_buttons", None)
@@ -171,12 +219,16 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
         # Reset all labels to original text without arrows
         for label_id, text in self.LABEL_TEXTS.items():
             try:
-                label = labels[label_id] if labels else self.query_one(f"#{label_id}", Label)
+                label = labels.get(label_id) if labels else self.query_one(f"#{label_id}", Label)
+                if label is None:
+                    # Password label is not mounted until password auth is first selected
+                    continue
                 label.update(text)
                 label.remove_class("highlighted")
             except Exception as e:
                 # Label might not exist yet during initial setup
-                logger.info(f"Could not update label {label_id}: {e}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Could not update label %s: %s", label_id, e)
 
         # Reset button highlights
         for btn_id in ["add-btn", "cancel-btn"]:
@@ -185,53 +237,49 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
                 btn.remove_class("highlighted-button")
             except Exception as e:
                 # Button might not exist yet during initial setup
-                logger.info(f"Could not update button {btn_id}: {e}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Could not update button %s: %s", btn_id, e)
 
-        # Get current field
-        field = self._get_current_field()
         if not field:
             return
 
-        # Skip if this field shouldn't be shown based on auth method
-        if "auth_type" in field and field["auth_type"] != self.auth_method:
-            # Move to next valid field
-            self._navigate_to_next_valid_field()
-            return
-
         # Add arrow and highlight to current field label
-        if field.get("label_id") and field["label_id"] in self.LABEL_TEXTS:
-            label = labels[field["label_id"]] if labels else self.query_one(f"#{field['label_id']}", Label)
+        lid = field.label_id
+        arrow_labels = self._EDIT_LABELS if self.in_edit_mode else self._NAV_LABELS
+        highlighted_text = arrow_labels.get(lid) if lid else None
+        if highlighted_text is not None:
+            label = labels[lid] if labels else self.query_one(f"#{lid}", Label)
             label.add_class("highlighted")
-            original_text = self.LABEL_TEXTS[field["label_id"]]
-
-            # Update label text to include arrow
-            if self.in_edit_mode:
-                label.update(f"▶ {original_text}")
-            else:
-                label.update(f"→ {original_text}")
+            label.update(highlighted_text)
 
         # Highlight button if current field is a button
-        if field["type"] == "button":
+        if field.type == "button":
             try:
-                btn = buttons[field["id"]] if buttons else self.query_one(f"#{field['id']}", Button)
+                btn = buttons[field.id] if buttons else self.query_one(f"#{field.id}", Button)
                 btn.add_class("highlighted-button")
             except Exception as e:
-                logger.warning(f"Failed to highlight button {field['id']}: {e}")
+                logger.warning(f"Failed to highlight button {field.id}: {e}")
 
         # Scroll to the highlighted field
         try:
-            widget = self._get_field_widget(field["id"], field["type"])
-            if field["type"] == "button" and hasattr(widget, "scroll_visible"):
+            widget = self._get_field_widget(field.id, field.type)
+            if field.type == "button" and hasattr(widget, "scroll_visible"):
                 widget.scroll_visible(animate=False)
             else:
                 # Get the field container (the Vertical holding the input)
                 field_container = widget.parent
                 if field_container and hasattr(field_container, "scroll_visible"):
-                    field_container.scroll_visible(animate=False)
+                    # Skip the scroll (and its geometry work) if the field is already fully in view
+                    fields_scroll = getattr(self, "_fields_scroll", None)
+                    if fields_scroll is None or not fields_scroll.content_region.contains_region(
+                        field_container.region
+                    ):
+                        field_container.scroll_visible(animate=False)
         except Exception as e:
-            logger.warning(f"Failed to scroll to field {field['id']}: {e}")
+            logger.warning(f"Failed to scroll to field {field.id}: {e}")
 
-        logger.info(f"Highlighted field {field['id']}, edit_mode={self.in_edit_mode}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Highlighted field %s, edit_mode=%s", field.id, self.in_edit_mode)
 
     def _get_field_widget(self, field_id: str, field_type: str) -> Input | OptionList | Button:
         """Get the cached widget for a field, or fall back to query_one.
@@ -276,7 +324,10 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
             field = self._get_current_field()
 
             # Check if this field should be shown
-            if "auth_type" not in field or field["auth_type"] == self.auth_method:
+            if field.auth_type is None or field.auth_type == self.auth_method:
+                # Wrapped back onto the starting field: highlight is already current
+                if self.current_field_index == original_index:
+                    return
                 self._update_field_highlights()
                 return
 
@@ -296,7 +347,10 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
             field = self._get_current_field()
 
             # Check if this field should be shown
-            if "auth_type" not in field or field["auth_type"] == self.auth_method:
+            if field.auth_type is None or field.auth_type == self.auth_method:
+                # Wrapped back onto the starting field: highlight is already current
+                if self.current_field_index == original_index:
+                    return
                 self._update_field_highlights()
                 return
 
@@ -316,11 +370,12 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
         # If we were on cancel-btn and moved to add-btn, skip it (they are on same row)
         # We want to go to the field above the buttons
         new_field = self._get_current_field()
-        if (current_field and current_field.get("id") == "cancel-btn" and
-            new_field and new_field.get("id") == "add-btn"):
+        if (current_field and current_field.id == "cancel-btn" and
+            new_field and new_field.id == "add-btn"):
             self._navigate_to_prev_valid_field()
 
-        logger.info(f"Navigated up to field index {self.current_field_index}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Navigated up to field index %d", self.current_field_index)
 
     def action_navigate_down(self) -> None:
         """Navigate to next field (only in navigation mode)."""
@@ -333,11 +388,12 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
         # If we were on add-btn and moved to cancel-btn, skip it (they are on same row)
         # We want to go to the field below the buttons (or wrap to top)
         new_field = self._get_current_field()
-        if (current_field and current_field.get("id") == "add-btn" and
-            new_field and new_field.get("id") == "cancel-btn"):
+        if (current_field and current_field.id == "add-btn" and
+            new_field and new_field.id == "cancel-btn"):
             self._navigate_to_next_valid_field()
 
-        logger.info(f"Navigated down to field index {self.current_field_index}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Navigated down to field index %d", self.current_field_index)
 
     def action_navigate_right(self) -> None:
         """Handle Right arrow key."""
@@ -346,14 +402,14 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
             return
 
         # Special handling for buttons
-        if field.get("id") == "add-btn":
+        if field.id == "add-btn":
             # Move to cancel button
             # We know cancel button is next, so use navigate_next
             self._navigate_to_next_valid_field()
             return
 
         # If it's a button (e.g. cancel), do nothing (don't activate)
-        if field["type"] == "button":
+        if field.type == "button":
             return
 
         # Otherwise behave like Enter (enter field)
@@ -371,7 +427,7 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
             return
 
         # Special handling for buttons
-        if field.get("id") == "cancel-btn":
+        if field.id == "cancel-btn":
             # Move to add button
             # We know add button is prev, so use navigate_prev
             self._navigate_to_prev_valid_field()
@@ -391,23 +447,24 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
         # Enter edit mode
         self.in_edit_mode = True
 
-        if field["type"] == "input":
-            widget = self._get_field_widget(field["id"], "input")
+        if field.type == "input":
+            widget = self._get_field_widget(field.id, "input")
             widget.disabled = False
             widget.focus()
-        elif field["type"] == "optionlist":
-            widget = self._get_field_widget(field["id"], "optionlist")
+        elif field.type == "optionlist":
+            widget = self._get_field_widget(field.id, "optionlist")
             widget.disabled = False
             widget.focus()
-        elif field["type"] == "button":
+        elif field.type == "button":
             # Buttons are activated immediately
             self.in_edit_mode = False
-            button = self._get_field_widget(field["id"], "button")
+            button = self._get_field_widget(field.id, "button")
             self.on_button_pressed(Button.Pressed(button))
             return
 
         self._update_field_highlights()
-        logger.info(f"Entered edit mode for field {field['id']}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Entered edit mode for field %s", field.id)
 
     def action_exit_field(self) -> None:
         """Exit edit mode (Left arrow or Enter)."""
@@ -421,21 +478,22 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
         # Exit edit mode
         self.in_edit_mode = False
 
-        if field["type"] == "input":
-            widget = self._get_field_widget(field["id"], "input")
+        if field.type == "input":
+            widget = self._get_field_widget(field.id, "input")
             widget.disabled = True
             widget.blur()
             # Return focus to the screen
             self.focus()
-        elif field["type"] == "optionlist":
-            widget = self._get_field_widget(field["id"], "optionlist")
+        elif field.type == "optionlist":
+            widget = self._get_field_widget(field.id, "optionlist")
             widget.disabled = True
             widget.blur()
             # Return focus to the screen
             self.focus()
 
         self._update_field_highlights()
-        logger.info(f"Exited edit mode for field {field['id']}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Exited edit mode for field %s", field.id)
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle Enter key pressed in an Input field."""
@@ -444,41 +502,96 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
             self.action_exit_field()
             event.stop()  # Prevent further propagation
 
+    def on_input_changed(self, _event: Input.Changed) -> None:
+        """Schedule live validation once typing pauses (trailing-edge debounce)."""
+        if self._validate_timer is not None:
+            self._validate_timer.stop()
+        self._validate_timer = self.set_timer(self.VALIDATION_DEBOUNCE, self._run_validation)
+
+    def _run_validation(self) -> None:
+        """Validate the basic fields and show errors in place of their help text."""
+        self._validate_timer = None
+        for input_id, help_id, _, validator, invalid_fallback in self._VALIDATORS:
+            value = self._inputs[input_id].value.strip()
+            help_label = self._help_labels[help_id]
+
+            # Empty fields are reported on submit, not while typing
+            result = validator(value) if value else None
+            if result is not None and not result.valid:
+                help_label.update(result.error_message or invalid_fallback)
+                help_label.add_class("invalid")
+            else:
+                help_label.update(self.HELP_TEXTS[help_id])
+                help_label.remove_class("invalid")
+
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         """Handle authentication method selection."""
         if event.option_list.id == "auth-method-list":
             self.auth_method = event.option.id
-            logger.info(f"Authentication method changed to: {self.auth_method}")
+            logger.debug("Authentication method changed to: %s", self.auth_method)
             self._update_auth_fields()
 
             # Exit edit mode and move to next field
             self.action_exit_field()
             self._navigate_to_next_valid_field()
-            logger.info("Auth method selected, moved to next field")
+            logger.debug("Auth method selected, moved to next field")
 
     def _update_auth_fields(self) -> None:
         """Show/hide authentication fields based on selected method."""
         # Use cached references if available
         key_container = getattr(self, "_key_container", None) or self.query_one("#key-container")
-        password_container = getattr(self, "_password_container", None) or self.query_one("#password-container")
 
         if self.auth_method == "key":
             key_container.remove_class("hidden")
-            password_container.add_class("hidden")
-            logger.info("Showing SSH key field, hiding password field")
+            if self._password_container is not None:
+                self._password_container.add_class("hidden")
+            logger.debug("Showing SSH key field, hiding password field")
         else:
+            password_container = self._password_container or self._mount_password_container(key_container)
             key_container.add_class("hidden")
             password_container.remove_class("hidden")
-            logger.info("Showing password field, hiding SSH key field")
+            logger.debug("Showing password field, hiding SSH key field")
+
+    def _mount_password_container(self, key_container: Widget) -> Vertical:
+        """Build and mount the password field below the SSH key field.
+
+        Most servers use key authentication, so the password widgets are only
+        created the first time password authentication is selected.
+
+        Args:
+            key_container: The SSH key field container to mount after
+
+        Returns:
+            The mounted password container
+        """
+        password_label = Label(self.LABEL_TEXTS["label-password"], classes="field-label", id="label-password")
+        password_input = Input(placeholder="Enter password", id="input-password", password=True, disabled=True)
+        password_container = Vertical(
+            password_label,
+            password_input,
+            Label("SSH password for authentication", classes="help-text"),
+            classes="field-container",
+            id="password-container",
+        )
+        key_container.parent.mount(password_container, after=key_container)
+
+        self._password_container = password_container
+        labels = getattr(self, "_labels", None)
+        if labels is not None:
+            labels["label-password"] = password_label
+        inputs = getattr(self, "_inputs", None)
+        if inputs is not None:
+            inputs["input-password"] = password_input
+        logger.debug("Password field mounted")
+        return password_container
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button clicks."""
-        if event.button.id == "add-btn":
-            logger.info("Add server button pressed, submitting form")
-            self._submit()
-        else:
-            logger.info("Add server cancelled via button")
-            self.dismiss(None)
+        handler = self._btn_handlers.get(event.button.id or "")
+        if handler is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Add server button pressed: %s", event.button.id)
+            handler()
 
     def action_submit(self) -> None:
         """Handle Ctrl+S keyboard shortcut to submit."""
@@ -492,54 +605,26 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
 
     def _submit(self) -> None:
         """Validate and submit the form."""
-        name = self.query_one("#input-name", Input).value.strip()
-        host = self.query_one("#input-host", Input).value.strip()
-        username = self.query_one("#input-username", Input).value.strip()
+        inputs = self._inputs
+        values = [inputs[input_id].value.strip() for input_id, *_ in self._VALIDATORS]
+        name, host, username = values
 
         logger.info(f"Add server form submitted: name={name}, host={host}, username={username}, auth_method={self.auth_method}")
 
-        # Validate required fields
-        if not name:
-            logger.warning("Add server form submission failed: missing server name")
-            self.notify("Server name is required", severity="error")
-            self.query_one("#input-name", Input).focus()
-            return
-
-        # Validate server name
-        name_validation = validate_server_name(name)
-        if not name_validation.valid:
-            logger.warning(f"Add server form submission failed: {name_validation.error_message}")
-            self.notify(name_validation.error_message or "Invalid server name", severity="error")
-            self.query_one("#input-name", Input).focus()
-            return
-
-        if not host:
-            logger.warning("Add server form submission failed: missing host")
-            self.notify("Host (IP or hostname) is required", severity="error")
-            self.query_one("#input-host", Input).focus()
-            return
-
-        # Validate hostname/IP
-        host_validation = validate_hostname(host)
-        if not host_validation.valid:
-            logger.warning(f"Add server form submission failed: {host_validation.error_message}")
-            self.notify(host_validation.error_message or "Invalid host", severity="error")
-            self.query_one("#input-host", Input).focus()
-            return
-
-        if not username:
-            logger.warning("Add server form submission failed: missing username")
-            self.notify("Username is required", severity="error")
-            self.query_one("#input-username", Input).focus()
-            return
+        # Validate required fields in form order, focusing the first bad one
+        for (input_id, _, empty_message, validator, invalid_fallback), value in zip(self._VALIDATORS, values, strict=True):
+            if not value:
+                logger.warning(f"Add server form submission failed: {empty_message}")
+                self.notify(empty_message, severity="error")
+                inputs[input_id].focus()
+                return
 
-        # Validate username
-        username_validation = validate_username(username)
-        if not username_validation.valid:
-            logger.warning(f"Add server form submission failed: {username_validation.error_message}")
-            self.notify(username_validation.error_message or "Invalid username", severity="error")
-            self.query_one("#input-username", Input).focus()
-            return
+            result = validator(value)
+            if not result.valid:
+                logger.warning(f"Add server form submission failed: {result.error_message}")
+                self.notify(result.error_message or invalid_fallback, severity="error")
+                inputs[input_id].focus()
+                return
 
         # Build server config with auth_method
         server_config_dict: dict[str, str | None] = {
@@ -551,22 +636,22 @@ class AddServerScreen(ModalScreen["ServerConfigDict | None"]):
 
         # Validate authentication-specific fields
         if self.auth_method == "key":
-            key_path = self.query_one("#input-keypath", Input).value.strip()
+            key_path = inputs["input-keypath"].value.strip()
             if not key_path:
                 logger.warning("Key path required for key authentication")
                 self.notify("SSH key path is required for key authentication", severity="error")
-                self.query_one("#input-keypath", Input).focus()
+                inputs["input-keypath"].focus()
                 return
 
             server_config_dict["key_path"] = key_path
         else:
             # For password auth, collect password but DON'T save it to config
             # It will be stored in memory only (passed to add_server callback)
-            password = self.query_one("#input-password", Input).value
+            password = inputs["input-password"].value
             if not password:
                 logger.warning("Password required for password authentication")
                 self.notify("Password is required for password authentication", severity="error")
-                self.query_one("#input-password", Input).focus()
+                inputs["input-password"].focus()
                 return
 
             # Pass password in memory, but it won't be saved to config file
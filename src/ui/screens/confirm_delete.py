@@ -9,6 +9,7 @@ from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Button, Label
+from textual.widgets.button import ButtonVariant
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,14 @@ class ConfirmDeleteScreen(ModalScreen[bool]):
         Binding("escape", "cancel", "Cancel"),
     ]
 
+    # Class-level constants for the dialog's static content
+    CONFIRM_SUBTEXT = "This will remove the server from config.yaml"
+    BUTTON_SPECS: tuple[tuple[str, ButtonVariant, str], ...] = (
+        # (label, variant, id)
+        ("Yes (y)", "error", "yes-btn"),
+        ("No (n)", "primary", "no-btn"),
+    )
+
     def __init__(self, server_name: str, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self.server_name = server_name
@@ -32,10 +41,10 @@ class ConfirmDeleteScreen(ModalScreen[bool]):
     def compose(self) -> ComposeResult:
         with Vertical(id="confirm-dialog"):
             yield Label(f"Delete server '{self.server_name}'?")
-            yield Label("This will remove the server from config.yaml")
+            yield Label(self.CONFIRM_SUBTEXT)
             with Horizontal(id="confirm-buttons"):
-                yield Button("Yes (y)", variant="error", id="yes-btn")
-                yield Button("No (n)", variant="primary", id="no-btn")
+                for label, variant, button_id in self.BUTTON_SPECS:
+                    yield Button(label, variant=variant, id=button_id)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         confirmed = event.button.id == "yes-btn"
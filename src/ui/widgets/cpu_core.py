@@ -10,11 +10,23 @@ from ...monitor import CPUCore
 
 logger = logging.getLogger(__name__)
 
+# Usage bar geometry: percent -> filled cells is a single multiply
+_BAR_WIDTH = 15
+_BAR_SCALE = _BAR_WIDTH / 100.0
+
+# Pre-rendered bars indexed by number of filled cells
+_BARS: tuple[str, ...] = tuple("█" * filled + "░" * (_BAR_WIDTH - filled) for filled in range(_BAR_WIDTH + 1))
+
 
 class CPUCoreWidget(Static):
     """Widget displaying a single CPU core's usage."""
 
-    usage_percent = reactive(0.0)
+    # Textual's Widget base keeps an instance __dict__, so this only moves our own
+    # per-core attributes into fixed slots
+    __slots__ = ("_core_id_str", "core")
+
+    # Repaints are driven by watch_usage_percent, only when the rendered text changes
+    usage_percent = reactive(0.0, layout=False, repaint=False)
 
     def __init__(self, core: CPUCore, **kwargs: Any) -> None:
         """Initialize CPU core widget.
@@ -24,6 +36,8 @@ class CPUCoreWidget(Static):
         """
         super().__init__(**kwargs)
         self.core = core
+        # Row prefix only depends on the core id, so format it once
+        self._core_id_str = f"  Core {core.core_id:2d}:"
         self.usage_percent = core.usage_percent
         logger.info(f"CPUCoreWidget initialized: core_id={core.core_id}, usage={core.usage_percent:.1f}%")
 
@@ -33,19 +47,29 @@ class CPUCoreWidget(Static):
         Args:
             core: Updated CPU core data
         """
-        logger.info(f"CPUCoreWidget updated: core_id={core.core_id}, usage={core.usage_percent:.1f}%")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("CPUCoreWidget updated: core_id=%d, usage=%.1f%%", core.core_id, core.usage_percent)
+        if core.core_id != self.core.core_id:
+            self._core_id_str = f"  Core {core.core_id:2d}:"
+            self.refresh()
         self.core = core
         self.usage_percent = core.usage_percent
-        self.refresh()
+
+    def watch_usage_percent(self, old_value: float, new_value: float) -> None:
+        """Repaint only when the displayed bar or percentage would change.
+
+        Args:
+            old_value: Previous usage percentage
+            new_value: New usage percentage
+        """
+        if int(old_value * _BAR_SCALE) != int(new_value * _BAR_SCALE) or round(old_value, 1) != round(new_value, 1):
+            self.refresh()
 
     def render(self) -> str:
         """Render the CPU core widget."""
         usage = self.usage_percent
-        bar_width = 15
-        filled = int((usage / 100.0) * bar_width)
-        bar = "█" * filled + "░" * (bar_width - filled)
+        # Clamp so out-of-range readings still map onto a cached bar
+        filled = min(max(int(usage * _BAR_SCALE), 0), _BAR_WIDTH)
 
         # Use consistent blue color
-        color = "dodger_blue2"
-
-        return f"  Core {self.core.core_id:2d}: [{color}]{bar}[/{color}] {usage:5.1f}%"
+        return f"{self._core_id_str} [dodger_blue2]{_BARS[filled]}[/dodger_blue2] {usage:5.1f}%"
@@ -1,11 +1,19 @@
 """Widget displaying CPU usage history as a custom bar chart."""
 
 import logging
+import math
+from bisect import bisect_left
+from collections import deque
+from collections.abc import Iterable, Sequence
+from itertools import repeat
 
 from textual.widgets import Static
 
 logger = logging.getLogger(__name__)
 
+# Timestamp placeholder for padding bars; compares unequal to every real timestamp
+_NO_SAMPLE = float("nan")
+
 
 class HistoryPlotWidget(Static):
     """Widget displaying CPU usage history as a vertical bar chart.
@@ -33,11 +41,58 @@ class HistoryPlotWidget(Static):
         super().__init__(**kwargs)
         self.history_window = history_window
         self.poll_interval = poll_interval
-        self._history_data: list[tuple[float, float]] = []
+        # Latest history as parallel columns (timestamps, usages)
+        self._history_timestamps: Sequence[float] = []
+        self._history_usages: Sequence[float] = []
         # Calculate the number of bars based on history window and poll interval
         self._num_bars = max(1, int(history_window / poll_interval))
-        # Start with zeros to fill the display area
-        self._display_data: list[float] = [0.0] * self._num_bars
+        # Fixed-size ring buffer of displayed values, pre-filled with zeros.
+        # New samples are appended on the right and push the oldest out on the left.
+        self._display_data: deque[float] = deque(repeat(0.0, self._num_bars), maxlen=self._num_bars)
+        # Timestamps of the displayed samples (NaN for padding), used to detect
+        # which samples in the next history update are new
+        self._display_times: deque[float] = deque(repeat(_NO_SAMPLE, self._num_bars), maxlen=self._num_bars)
+
+        # Lookup tables for classifying a value into a whole bar column at once.
+        # A value fills every row whose threshold it reaches (value >= threshold),
+        # plus a half block in the row above if it is over that row's lower bound
+        # (value > bound). Writing "value >= t" as "value > nextafter(t, -inf)" makes
+        # every boundary strict, so the column code (full_rows * 2 + has_partial) is
+        # simply the number of boundaries below the value: one bisect_left.
+        height = self.PLOT_HEIGHT
+        row_thresholds = [100.0 - (row * 100.0 / height) for row in range(height)]
+        partial_bounds = [100.0 - ((height - full) * 100.0 / height) for full in range(height)]
+        self._code_bounds = sorted(
+            partial_bounds + [math.nextafter(threshold, -math.inf) for threshold in row_thresholds]
+        )
+        # Column glyphs (top to bottom) indexed by code = full_rows * 2 + has_partial
+        self._column_glyphs: list[str] = []
+        for full in range(height + 1):
+            for partial in (0, 1):
+                empty = height - full - partial
+                self._column_glyphs.append(" " * max(empty, 0) + "▄" * partial + "█" * full)
+
+        # Static chart frame, built once: y-axis labels and colour markup around
+        # each row, then the x-axis and time labels below the chart
+        self._row_prefixes: list[str] = []
+        self._row_suffixes: list[str] = []
+        for row in range(height):
+            # Threshold for this row (100% at top, 0% at bottom), labelled every other row
+            threshold = 100.0 - (row * 100.0 / height)
+            y_label = f"{int(threshold):3d}%" if row % 2 == 0 else "    "
+            self._row_prefixes.append(f"{y_label}│[{self.BAR_COLOR}]")
+            self._row_suffixes.append(f"[/{self.BAR_COLOR}]│{y_label}")
+        self._footer_lines = (
+            "    └" + "─" * self._num_bars + "┘",
+            f"    -{self.history_window}s{' ' * (self._num_bars - 6)}now",
+        )
+
+        # Column code per displayed value, and the chart rows built from them.
+        # Codes are the values quantized to what the chart can show (at most
+        # 2 * PLOT_HEIGHT + 2 levels), stored one byte per column.
+        # Rows are patched on each poll rather than rebuilt cell by cell in render().
+        self._codes = bytearray(self._num_bars)
+        self._bar_lines: list[str] = self._bar_rows(self._codes)
 
         logger.info(
             f"HistoryPlotWidget initialized with "
@@ -47,98 +102,147 @@ class HistoryPlotWidget(Static):
 
     @property
     def history_data(self) -> list[tuple[float, float]]:
-        """Get the history data (for backwards compatibility)."""
-        return self._history_data
+        """Get the history data as (timestamp, usage) tuples (for backwards compatibility)."""
+        return list(zip(self._history_timestamps, self._history_usages, strict=True))
 
     @property
-    def data(self) -> list[float]:
+    def data(self) -> deque[float]:
         """Get the display data (for backwards compatibility with tests)."""
         return self._display_data
 
     def update_history(self, history_data: list[tuple[float, float]]) -> None:
+        """Update history data from (timestamp, usage) tuples.
+
+        Args:
+            history_data: List of (timestamp, usage) tuples
+        """
+        timestamps = [timestamp for timestamp, _ in history_data]
+        usages = [usage for _, usage in history_data]
+        self.update_history_columns(timestamps, usages)
+
+    def update_history_columns(self, timestamps: Sequence[float], usages: Sequence[float]) -> None:
         """Update history data with sliding window effect.
 
         New data appears on the right, old data slides to the left.
         Always maintains _num_bars data points for consistent bar width.
 
         Args:
-            history_data: List of (timestamp, usage) tuples
+            timestamps: Sample timestamps, oldest first
+            usages: Usage percentages, parallel to timestamps
         """
-        self._history_data = history_data
-        data_points = len(history_data)
-
-        if data_points > 0:
-            time_span = (
-                history_data[-1][0] - history_data[0][0] if data_points >= 2 else 0
-            )
-            logger.info(
-                f"HistoryPlotWidget updated: {data_points} data points over {time_span:.1f}s"
-            )
-
-        # Extract just the usage values
-        usages = [usage for _, usage in history_data]
+        self._history_timestamps = timestamps
+        self._history_usages = usages
+        data_points = len(timestamps)
+
+        if data_points > 0 and logger.isEnabledFor(logging.INFO):
+            time_span = timestamps[-1] - timestamps[0] if data_points >= 2 else 0
+            logger.info("HistoryPlotWidget updated: %d data points over %.1fs", data_points, time_span)
 
         # Create display data with sliding window effect
         # Oldest data on left, newest on right
-        if len(usages) >= self._num_bars:
-            # Take the most recent _num_bars points
-            # (oldest first/left, newest last/right)
-            self._display_data = usages[-self._num_bars:]
+        num_bars = self._num_bars
+        display = self._display_data
+        display_times = self._display_times
+        new_samples = self._count_new_samples(timestamps) if data_points >= num_bars else None
+        if new_samples is None:
+            # Short history, or not a continuation of what is displayed: refill the
+            # buffers, padding first so a short history ends up padded on the left
+            display.extend(repeat(0.0, num_bars))
+            display.extend(usages[-num_bars:])
+            display_times.extend(repeat(_NO_SAMPLE, num_bars))
+            display_times.extend(timestamps[-num_bars:])
+            codes = self._column_codes(display)
+            if codes == self._codes:
+                # Same columns as already drawn (e.g. an all-idle history): no repaint
+                return
+            self._codes[:] = codes
+            self._bar_lines = self._bar_rows(codes)
+        elif new_samples:
+            # Steady state: only the newly polled samples are appended, and the
+            # cached rows scroll left by the same number of columns
+            new_usages = usages[-new_samples:]
+            display.extend(new_usages)
+            display_times.extend(timestamps[-new_samples:])
+            new_codes = self._column_codes(new_usages)
+            codes = self._codes[new_samples:] + new_codes
+            if codes == self._codes:
+                return
+            self._codes = codes
+            self._bar_lines = [
+                line[new_samples:] + tail
+                for line, tail in zip(self._bar_lines, self._bar_rows(new_codes), strict=True)
+            ]
         else:
-            # Pad with zeros on the left, usages on the right (newest at end)
-            self._display_data = [0.0] * (self._num_bars - len(usages)) + usages
+            # No new samples since the last update: nothing to redraw
+            return
 
         # Re-render the chart with new data
         self.refresh()
 
+    def _count_new_samples(self, timestamps: Sequence[float]) -> int | None:
+        """Count samples newer than the ones already displayed.
+
+        Args:
+            timestamps: Sample timestamps, oldest first
+
+        Returns:
+            Number of new trailing samples, or None if the history does not
+            continue the displayed data and the buffer must be refilled
+        """
+        display_times = self._display_times
+        last_timestamp = display_times[-1]
+        num_bars = self._num_bars
+        data_points = len(timestamps)
+        new_samples = 0
+        while new_samples < data_points and timestamps[-1 - new_samples] > last_timestamp:
+            new_samples += 1
+            if new_samples >= num_bars:
+                return None
+        # The samples before the new ones must be exactly the ones still on screen:
+        # same newest entry, and the same entry now scrolled to the left edge (the
+        # latter catches entries trimmed from inside the window after a clock step)
+        if (
+            new_samples == data_points
+            or timestamps[-1 - new_samples] != last_timestamp
+            or timestamps[-num_bars] != display_times[new_samples]
+        ):
+            return None
+        return new_samples
+
+    def _column_codes(self, values: Iterable[float]) -> bytes:
+        """Classify values into column codes (full_rows * 2 + has_partial).
+
+        Args:
+            values: Usage percentages
+
+        Returns:
+            One code byte per value, indexing into the column glyph table
+        """
+        # map() keeps the per-value loop in C
+        return bytes(map(bisect_left, repeat(self._code_bounds), values))
+
+    def _bar_rows(self, codes: Iterable[int]) -> list[str]:
+        """Build chart rows (top to bottom) from column codes.
+
+        Args:
+            codes: Column codes, oldest first
+
+        Returns:
+            PLOT_HEIGHT strings, one character per column
+        """
+        glyphs = self._column_glyphs
+        return ["".join(row_chars) for row_chars in zip(*(glyphs[code] for code in codes), strict=True)]
+
     def render(self) -> str:
         """Render the history plot as a simple multi-line string."""
         if not self._display_data:
             return "[dim]No data available[/dim]"
 
-        lines = []
-
-        # Build the chart - 10 rows from 100% (top) to 0% (bottom)
-        for row in range(self.PLOT_HEIGHT):
-            # Calculate threshold for this row (100% at top, 0% at bottom)
-            threshold = 100.0 - (row * 100.0 / self.PLOT_HEIGHT)
-
-            # Y-axis label (every other row for readability)
-            if row % 2 == 0:
-                y_label = f"{int(threshold):3d}%"
-            else:
-                y_label = "    "
-
-            # Build the bar characters for this row
-            bars = []
-            for value in self._display_data:
-                # Determine if this cell should be filled based on value
-                next_threshold = 100.0 - ((row + 1) * 100.0 / self.PLOT_HEIGHT)
-                if value >= threshold:
-                    bars.append("█")
-                elif value > next_threshold:
-                    # Partial fill
-                    bars.append("▄")
-                else:
-                    bars.append(" ")
-
-            # Join bars and add color
-            bar_line = "".join(bars)
-
-            # Right Y-axis label (every other row for readability)
-            if row % 2 == 0:
-                y_label_right = f"{int(threshold):3d}%"
-            else:
-                y_label_right = "    "
-
-            lines.append(f"{y_label}│[{self.BAR_COLOR}]{bar_line}[/{self.BAR_COLOR}]│{y_label_right}")
-
-        # X-axis line
-        x_axis = "    └" + "─" * len(self._display_data) + "┘"
-        lines.append(x_axis)
-
-        # Time labels
-        time_label = f"    -{self.history_window}s{' ' * (len(self._display_data) - 6)}now"
-        lines.append(time_label)
+        # Cached bar rows wrapped in the precomputed axis frame
+        lines = [
+            f"{prefix}{bar_line}{suffix}"
+            for prefix, bar_line, suffix in zip(self._row_prefixes, self._bar_lines, self._row_suffixes, strict=True)
+        ]
+        lines.extend(self._footer_lines)
 
         return "\n".join(lines)
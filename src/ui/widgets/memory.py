@@ -9,6 +9,13 @@ from ...monitor import MemoryInfo
 
 logger = logging.getLogger(__name__)
 
+# Usage bar geometry: percent -> filled cells is a single multiply
+_BAR_WIDTH = 25
+_BAR_SCALE = _BAR_WIDTH / 100.0
+
+# Pre-rendered bars indexed by number of filled cells
+_BARS: tuple[str, ...] = tuple("█" * filled + "░" * (_BAR_WIDTH - filled) for filled in range(_BAR_WIDTH + 1))
+
 
 class MemoryWidget(Static):
     """Widget displaying memory usage."""
@@ -26,7 +33,11 @@ class MemoryWidget(Static):
             memory_info: Updated memory information
         """
         if memory_info:
-            logger.info(f"MemoryWidget updated: usage={memory_info.usage_percent:.1f}%, used={memory_info.used_mb/1024:.1f}GB/{memory_info.total_mb/1024:.1f}GB")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "MemoryWidget updated: usage=%.1f%%, used=%.1fGB/%.1fGB",
+                    memory_info.usage_percent, memory_info.used_gb, memory_info.total_gb,
+                )
         else:
             logger.warning("MemoryWidget updated with no data")
         self.memory_info = memory_info
@@ -39,14 +50,8 @@ class MemoryWidget(Static):
 
         mem = self.memory_info
         usage = mem.usage_percent
-        bar_width = 25
-        filled = int((usage / 100.0) * bar_width)
-        bar = "█" * filled + "░" * (bar_width - filled)
+        # Clamp so out-of-range readings still map onto a cached bar
+        filled = min(max(int(usage * _BAR_SCALE), 0), _BAR_WIDTH)
 
         # Use consistent blue color
-        color = "dodger_blue2"
-
-        used_gb = mem.used_mb / 1024.0
-        total_gb = mem.total_mb / 1024.0
-
-        return f"[{color}]{bar}[/{color}] {usage:5.1f}% ({used_gb:.1f}/{total_gb:.1f} GB)"
+        return f"[dodger_blue2]{_BARS[filled]}[/dodger_blue2] {usage:5.1f}% ({mem.used_gb:.1f}/{mem.total_gb:.1f} GB)"
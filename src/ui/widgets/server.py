@@ -2,6 +2,7 @@
 
 import logging
 import time
+from collections.abc import Sequence
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal, Vertical
@@ -25,6 +26,17 @@ class ServerWidget(Static):
     # Spinner animation frames
     SPINNER_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
 
+    # Header opening (bold markup, selection marker, expand icon) and closing markup,
+    # keyed by (is_selected, expanded)
+    _HEADER_FRAMES: dict[tuple[bool, bool], tuple[str, str]] = {
+        (selected, expanded): (
+            f"{'[bold]→' if selected else ' '} {'▼' if expanded else '▶'} ",
+            "[/bold]" if selected else "",
+        )
+        for selected in (False, True)
+        for expanded in (False, True)
+    }
+
     def __init__(
         self,
         server_name: str,
@@ -52,11 +64,14 @@ class ServerWidget(Static):
         self.memory_widget: MemoryWidget | None = None
         self.history_widget: HistoryPlotWidget | None = None
         self.header_widget: Static | None = None
+        self.cores_content: Vertical | None = None  # Container holding the core widgets
         self.content_layout: Horizontal | None = None  # Main content container
         self.is_selected = False
         self._spinner_index = 0
         self._connection_start_time: float | None = None
         self._retry_count = 0
+        # Signature of the last metrics applied to the child widgets (see _metrics_signature)
+        self._last_signature: tuple | None = None
 
         # Set expanded after all attributes are initialized (watcher-safe)
         self.expanded = False  # Always start collapsed
@@ -74,7 +89,8 @@ class ServerWidget(Static):
             # Left column: CPU Cores Section
             with Vertical(id=f"cores-{safe_id}", classes="left-column"):
                 yield Static("CPU CORES", classes="section-header")
-                yield Vertical(id=f"cores-content-{safe_id}", classes="section-content")
+                self.cores_content = Vertical(id=f"cores-content-{safe_id}", classes="section-content")
+                yield self.cores_content
 
             # Right column: Memory and History stacked vertically
             with Vertical(classes="right-column"):
@@ -96,20 +112,24 @@ class ServerWidget(Static):
     def on_mount(self):
         """Handle widget mount event."""
         logger.info(f"ServerWidget mounted: {self.server_name}")
-        # Start spinner animation timer (0.1s interval for smooth animation)
-        self._spinner_timer = self.set_interval(0.1, self._animate_spinner)
         self.refresh_display()
 
-    def _animate_spinner(self) -> None:
-        """Advance the spinner animation frame.
+    @property
+    def is_spinning(self) -> bool:
+        """Whether the header shows a spinner (not connected yet)."""
+        return self.metrics is None or not self.metrics.connected
+
+    def set_spinner_frame(self, frame_index: int) -> None:
+        """Show the given spinner animation frame.
+
+        Called by the app's shared animation timer, independently of the UI
+        update loop, for widgets that are currently spinning.
 
-        This is called by the timer to animate the spinner independently
-        of the UI update loop.
+        Args:
+            frame_index: Index into SPINNER_FRAMES
         """
-        # Only animate if we're showing a spinner (not connected)
-        if self.metrics is None or not self.metrics.connected:
-            self._spinner_index = (self._spinner_index + 1) % len(self.SPINNER_FRAMES)
-            self._update_header()
+        self._spinner_index = frame_index
+        self._update_header()
 
     def update_metrics(self, metrics: ServerMetrics):
         """Update server metrics.
@@ -117,10 +137,20 @@ class ServerWidget(Static):
         Args:
             metrics: Updated server metrics
         """
-        logger.info(f"ServerWidget updating metrics: server={self.server_name}, connected={metrics.connected}, cores={len(metrics.cores)}, overall_usage={metrics.overall_usage:.1f}%")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "ServerWidget updating metrics: server=%s, connected=%s, cores=%d, overall_usage=%.1f%%",
+                self.server_name, metrics.connected, len(metrics.cores), metrics.overall_usage,
+            )
 
         self.metrics = metrics
 
+        # Idle servers often report the same readings poll after poll: nothing on
+        # screen would change, so skip the core, memory and header updates
+        signature = self._metrics_signature(metrics)
+        if signature == self._last_signature:
+            return
+
         # Track connection state changes
         if metrics.connected:
             if self._connection_start_time is not None:
@@ -133,31 +163,32 @@ class ServerWidget(Static):
             self._connection_start_time = time.time()
 
         # Update or create core widgets
-        if metrics.connected and metrics.cores:
-            safe_id = self.server_name.replace(" ", "-")
-            cores_content = self.query_one(f"#cores-content-{safe_id}")
-
-            # Remove excess core widgets
-            removed_count = 0
-            while len(self.core_widgets) > len(metrics.cores):
-                widget = self.core_widgets.pop()
-                widget.remove()
-                removed_count += 1
-            if removed_count > 0:
-                logger.info(f"ServerWidget '{self.server_name}': removed {removed_count} excess core widgets")
-
-            # Update existing or add new core widgets
-            added_count = 0
-            for i, core in enumerate(metrics.cores):
-                if i < len(self.core_widgets):
-                    self.core_widgets[i].update_core(core)
-                else:
-                    core_widget = CPUCoreWidget(core)
-                    self.core_widgets.append(core_widget)
-                    cores_content.mount(core_widget)
-                    added_count += 1
-            if added_count > 0:
-                logger.info(f"ServerWidget '{self.server_name}': added {added_count} new core widgets")
+        cores_content = self.cores_content
+        # Before compose there is nowhere to show the cores, so the same
+        # readings must not be skipped once the container exists
+        if cores_content is not None:
+            self._last_signature = signature
+        if cores_content and metrics.connected and metrics.cores:
+
+            core_count = len(metrics.cores)
+
+            # Remove excess core widgets in one DOM operation
+            excess_widgets = self.core_widgets[core_count:]
+            if excess_widgets:
+                del self.core_widgets[core_count:]
+                cores_content.remove_children(excess_widgets)
+                logger.info(f"ServerWidget '{self.server_name}': removed {len(excess_widgets)} excess core widgets")
+
+            # Update existing core widgets
+            for core_widget, core in zip(self.core_widgets, metrics.cores, strict=False):
+                core_widget.update_core(core)
+
+            # Add widgets for new cores, mounted together so layout runs once
+            new_widgets = [CPUCoreWidget(core) for core in metrics.cores[len(self.core_widgets):]]
+            if new_widgets:
+                self.core_widgets.extend(new_widgets)
+                cores_content.mount_all(new_widgets)
+                logger.info(f"ServerWidget '{self.server_name}': added {len(new_widgets)} new core widgets")
 
         # Update memory widget
         if self.memory_widget and metrics.connected:
@@ -168,6 +199,34 @@ class ServerWidget(Static):
         # Refresh display to update UI
         self.refresh_display()
 
+    @staticmethod
+    def _metrics_signature(metrics: ServerMetrics) -> tuple:
+        """Build a key that changes whenever the displayed metrics would change.
+
+        The header shows the overall usage to one decimal, so that is rounded.
+        Core bars and the memory bar depend on the exact percentages, so those
+        are compared as-is.
+
+        Args:
+            metrics: Server metrics
+
+        Returns:
+            Hashable signature of the displayed state
+        """
+        memory = metrics.memory
+        memory_key = (
+            (memory.usage_percent, round(memory.used_gb, 1), round(memory.total_gb, 1))
+            if memory
+            else None
+        )
+        return (
+            metrics.connected,
+            metrics.error_message,
+            round(metrics.overall_usage, 1),
+            tuple([core.usage_percent for core in metrics.cores]),
+            memory_key,
+        )
+
     def toggle_expanded(self):
         """Toggle expanded/collapsed state."""
         self.expanded = not self.expanded
@@ -194,6 +253,16 @@ class ServerWidget(Static):
         if self.history_widget:
             self.history_widget.update_history(history_data)
 
+    def update_history_columns(self, timestamps: Sequence[float], usages: Sequence[float]):
+        """Update CPU history data from parallel columns.
+
+        Args:
+            timestamps: Sample timestamps, oldest first
+            usages: Usage percentages, parallel to timestamps
+        """
+        if self.history_widget:
+            self.history_widget.update_history_columns(timestamps, usages)
+
     def set_selected(self, selected: bool):
         """Set selection state.
 
@@ -210,12 +279,8 @@ class ServerWidget(Static):
         if not self.header_widget:
             return
 
-        # Build header
-        expand_icon = "▼" if self.expanded else "▶"
-        selection_marker = "→" if self.is_selected else " "
-
         if self.metrics is None:
-            # Spinner animation is handled by _animate_spinner timer
+            # Spinner animation is driven by the app's shared timer via set_spinner_frame
             spinner = self.SPINNER_FRAMES[self._spinner_index]
             status = f"[cyan]{spinner} Initializing...[/cyan]"
         elif not self.metrics.connected:
@@ -231,19 +296,11 @@ class ServerWidget(Static):
                 status = f"[red]✗ {error}[/red]"
         else:
             # Use consistent blue color
-            usage = self.metrics.overall_usage
-            color = "dodger_blue2"
-
-            core_count = self.metrics.core_count
-            status = f"[{color}]✓ {usage:5.1f}% avg ({core_count} cores)[/{color}]"
-
-        header_style = "bold" if self.is_selected else ""
-        if header_style:
-            header_text = f"[{header_style}]{selection_marker} {expand_icon} {self.server_name}: {status}[/{header_style}]"
-        else:
-            header_text = f"{selection_marker} {expand_icon} {self.server_name}: {status}"
+            metrics = self.metrics
+            status = f"[dodger_blue2]✓ {metrics.overall_usage:5.1f}% avg ({metrics.core_count} cores)[/dodger_blue2]"
 
-        self.header_widget.update(header_text)
+        opening, closing = self._HEADER_FRAMES[self.is_selected, self.expanded]
+        self.header_widget.update(f"{opening}{self.server_name}: {status}{closing}")
 
     def refresh_display(self):
         """Refresh the display of this widget.
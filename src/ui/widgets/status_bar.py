@@ -19,6 +19,11 @@ class StatusBar(Static):
         self.average_cpu = 0.0
         self.last_update = ""
         self._status_text = "Initializing..."
+        # Last formatted update time, keyed by whole second
+        self._last_update_second = -1
+        self._last_update_str = "--:--:--"
+        # Displayed state from the last rebuild, to skip identical updates
+        self._last_stats_signature: tuple | None = None
         logger.info("StatusBar initialized")
 
     def update_stats(
@@ -41,12 +46,27 @@ class StatusBar(Static):
         self.average_cpu = average_cpu
 
         if last_update_time:
-            dt = datetime.fromtimestamp(last_update_time, tz=UTC)
-            self.last_update = dt.strftime("%H:%M:%S")
+            # Only whole seconds are shown, so reformat only when a new second starts
+            second = int(last_update_time)
+            if second != self._last_update_second:
+                self._last_update_second = second
+                self._last_update_str = datetime.fromtimestamp(second, tz=UTC).strftime("%H:%M:%S")
+            self.last_update = self._last_update_str
         else:
             self.last_update = "--:--:--"
 
-        logger.info(f"StatusBar updated: total={total}, connected={connected}, disconnected={total-connected}, avg_cpu={average_cpu:.1f}%, updated={self.last_update}")
+        # Everything the status text shows: counts, average to one decimal, its
+        # colour band, and the formatted time
+        signature = (total, connected, round(average_cpu, 1), average_cpu < 30, average_cpu < 70, self.last_update)
+        if signature == self._last_stats_signature:
+            return
+        self._last_stats_signature = signature
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "StatusBar updated: total=%d, connected=%d, disconnected=%d, avg_cpu=%.1f%%, updated=%s",
+                total, connected, total - connected, average_cpu, self.last_update,
+            )
         self.refresh_display()
 
     def refresh_display(self):
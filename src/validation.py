@@ -2,7 +2,30 @@
 
 import ipaddress
 import re
-from typing import NamedTuple
+from collections.abc import Mapping
+from typing import Any, NamedTuple
+
+
+# Hostname pattern: labels of alphanumerics and hyphens separated by dots, where no
+# label may start or end with a hyphen. Possessive quantifiers (*+, {1,63}+) make this
+# a single forward scan: a label's characters can never be re-matched as a dot, so
+# backtracking could never succeed.
+_HOSTNAME_PATTERN = re.compile(
+    r"^(?:(?!-)[a-zA-Z0-9-]{1,63}+(?<!-)\.)*+"  # Labels separated by dots
+    r"(?!-)[a-zA-Z0-9-]{1,63}+(?<!-)$"  # Final label
+)
+
+# Translation table deleting ASCII control characters (code points below 32)
+_CTRL_TABLE = str.maketrans("", "", "".join(map(chr, range(32))))
+
+# Username pattern: alphanumeric, underscore, hyphen, and dot (common in practice)
+_USERNAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9._-]*$")
+
+# Keys every server entry in the config file must define (auth_method defaults to "key")
+_REQUIRED_SERVER_FIELDS = frozenset({"name", "host", "username"})
+
+# Supported values for a server entry's auth_method
+_AUTH_METHODS = frozenset({"key", "password"})
 
 
 class ValidationResult(NamedTuple):
@@ -12,6 +35,10 @@ class ValidationResult(NamedTuple):
     error_message: str | None = None
 
 
+# Shared success result; ValidationResult is immutable, so every validator can return it
+_OK = ValidationResult(valid=True)
+
+
 def validate_hostname(hostname: str) -> ValidationResult:
     """Validate a hostname or IP address.
 
@@ -29,14 +56,14 @@ def validate_hostname(hostname: str) -> ValidationResult:
     # Try to parse as IP address first
     try:
         ipaddress.ip_address(hostname)
-        return ValidationResult(valid=True)
+        return _OK
     except ValueError:
         pass
 
     # Validate as hostname (RFC 1123)
     # Hostname rules:
     # - Can contain alphanumeric characters and hyphens
-    # - Cannot start or end with hyphen
+    # - Labels cannot start or end with hyphen
     # - Each label (part between dots) can be up to 63 characters
     # - Total length up to 253 characters
     # - Must not be just numbers (to avoid confusion with IPs)
@@ -48,30 +75,13 @@ def validate_hostname(hostname: str) -> ValidationResult:
     if hostname.replace(".", "").isdigit():
         return ValidationResult(valid=False, error_message="Invalid IP address format")
 
-    # Hostname pattern: alphanumeric and hyphens, with dots separating labels
-    hostname_pattern = re.compile(
-        r"^(?!-)"  # Cannot start with hyphen
-        r"(?:[a-zA-Z0-9-]{1,63}\.)*"  # Labels separated by dots
-        r"[a-zA-Z0-9-]{1,63}"  # Final label
-        r"(?<!-)$"  # Cannot end with hyphen
-    )
-
-    if not hostname_pattern.match(hostname):
+    if not _HOSTNAME_PATTERN.match(hostname):
         return ValidationResult(
             valid=False,
             error_message="Invalid hostname format (use alphanumeric, hyphens, and dots)"
         )
 
-    # Check each label doesn't start/end with hyphen
-    labels = hostname.split(".")
-    for label in labels:
-        if label.startswith("-") or label.endswith("-"):
-            return ValidationResult(
-                valid=False,
-                error_message=f"Hostname label '{label}' cannot start or end with hyphen"
-            )
-
-    return ValidationResult(valid=True)
+    return _OK
 
 
 def validate_username(username: str) -> ValidationResult:
@@ -101,16 +111,14 @@ def validate_username(username: str) -> ValidationResult:
         )
 
     # Allow alphanumeric, underscore, hyphen, and dot (common in practice)
-    username_pattern = re.compile(r"^[a-zA-Z_][a-zA-Z0-9._-]*$")
-
-    if not username_pattern.match(username):
+    if not _USERNAME_PATTERN.match(username):
         return ValidationResult(
             valid=False,
             error_message="Invalid username format (must start with letter/underscore, "
                          "contain only alphanumeric, underscore, hyphen, or dot)"
         )
 
-    return ValidationResult(valid=True)
+    return _OK
 
 
 def validate_server_name(name: str) -> ValidationResult:
@@ -130,14 +138,15 @@ def validate_server_name(name: str) -> ValidationResult:
     if len(name) > 64:
         return ValidationResult(valid=False, error_message="Server name too long (max 64 characters)")
 
-    # Allow most characters but avoid control characters
-    if any(ord(c) < 32 for c in name):
+    # Allow most characters but avoid control characters: translate() drops them in
+    # a single C-level pass, so any change in length means one was present
+    if len(name.translate(_CTRL_TABLE)) != len(name):
         return ValidationResult(
             valid=False,
             error_message="Server name contains invalid control characters"
         )
 
-    return ValidationResult(valid=True)
+    return _OK
 
 
 def validate_port(port: str | int) -> ValidationResult:
@@ -149,10 +158,13 @@ def validate_port(port: str | int) -> ValidationResult:
     Returns:
         ValidationResult indicating if the port is valid
     """
-    try:
-        port_num = int(port)
-    except (ValueError, TypeError):
-        return ValidationResult(valid=False, error_message="Port must be a number")
+    if isinstance(port, int):
+        port_num = port
+    else:
+        try:
+            port_num = int(port)
+        except (ValueError, TypeError):
+            return ValidationResult(valid=False, error_message="Port must be a number")
 
     if port_num < 1 or port_num > 65535:
         return ValidationResult(
@@ -160,4 +172,34 @@ def validate_port(port: str | int) -> ValidationResult:
             error_message="Port must be between 1 and 65535"
         )
 
-    return ValidationResult(valid=True)
+    return _OK
+
+
+def validate_server_config(server: Any) -> ValidationResult:
+    """Validate the shape of a server entry from the configuration file.
+
+    Mirrors the checks ServerConfig performs, so a bad entry can be rejected
+    while loading the file, before any client, monitor, or widget is built.
+
+    Args:
+        server: One item of the config's ``servers`` list
+
+    Returns:
+        ValidationResult describing the first problem found, if any
+    """
+    if not isinstance(server, Mapping):
+        return ValidationResult(valid=False, error_message="Server entry must be a mapping")
+
+    # One set difference against the key view instead of a membership test per field
+    missing = _REQUIRED_SERVER_FIELDS - server.keys()
+    if missing:
+        return ValidationResult(valid=False, error_message=f"Missing required field(s): {', '.join(sorted(missing))}")
+
+    auth_method = server.get("auth_method", "key")
+    if auth_method not in _AUTH_METHODS:
+        return ValidationResult(valid=False, error_message="auth_method must be 'key' or 'password'")
+
+    if auth_method == "key" and not server.get("key_path"):
+        return ValidationResult(valid=False, error_message="key_path is required when auth_method is 'key'")
+
+    return _OK
@@ -1,11 +1,100 @@
 """Tests for AddServerScreen two-level navigation system."""
 
-from unittest.mock import Mock, patch
+from dataclasses import dataclass
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 import pytest
-from textual.widgets import Input
 
 from src.ui.screens import AddServerScreen
+from src.ui.types import FieldDefinition
+
+
+@dataclass
+class FakeInput:
+    """Lightweight Input double with only the attributes the screen touches."""
+
+    value: str = ""
+    disabled: bool = False
+    focus_count: int = 0
+    blur_count: int = 0
+
+    def focus(self) -> None:
+        self.focus_count += 1
+
+    def blur(self) -> None:
+        self.blur_count += 1
+
+
+# Returned by stub_query_one for selectors a test did not register
+DUMMY_WIDGET = SimpleNamespace()
+
+
+def stub_query_one(mapping):
+    """Build a query_one replacement that resolves selectors from a fixed mapping."""
+    return lambda selector, *_args, **_kwargs: mapping.get(selector, DUMMY_WIDGET)
+
+
+# Shared field definitions; FieldDefinition is a NamedTuple, so these are safe to reuse across tests
+_NAME = FieldDefinition("input-name", "label-name", "input")
+_HOST = FieldDefinition("input-host", "label-host", "input")
+_KEYPATH = FieldDefinition("input-keypath", "label-keypath", "input", "key")
+_PASSWORD = FieldDefinition("input-password", "label-password", "input", "password")
+_ADD_BTN = FieldDefinition("add-btn", None, "button")
+_CANCEL_BTN = FieldDefinition("cancel-btn", None, "button")
+
+# Field layouts used by tests that don't care about the exact form layout
+DEFAULT_FIELDS = (_NAME, _HOST)
+FIELDS_AUTH = (_NAME, _KEYPATH, _PASSWORD, _ADD_BTN)
+FIELDS_BUTTONS = (_NAME, _ADD_BTN, _CANCEL_BTN)
+
+
+# Action and helper methods the navigation system relies on
+METHOD_NAMES = (
+    "action_navigate_up",
+    "action_navigate_down",
+    "action_navigate_right",
+    "action_navigate_left",
+    "action_enter_field",
+    "action_exit_field",
+    "action_cancel",
+    "action_submit",
+    "_get_current_field",
+    "_update_field_highlights",
+    "_navigate_to_next_valid_field",
+    "_navigate_to_prev_valid_field",
+    "_update_auth_fields",
+)
+
+
+@pytest.fixture
+def make_screen():
+    """Create a factory for AddServerScreen instances with navigation state preset.
+
+    Highlight updates are mocked, since they need a mounted DOM.
+    """
+    def _make(fields=DEFAULT_FIELDS, idx=0, edit=False, auth="key"):
+        screen = AddServerScreen()
+        screen.fields = fields
+        screen.current_field_index = idx
+        screen.in_edit_mode = edit
+        screen.auth_method = auth
+        screen._update_field_highlights = Mock()
+        return screen
+
+    return _make
+
+
+@pytest.fixture(scope="class")
+def shared_screen():
+    """Create one AddServerScreen per class for read-only introspection tests."""
+    return AddServerScreen()
+
+
+@pytest.fixture(scope="class")
+def bindings_map():
+    """Map each AddServerScreen binding key to its action, built once per class."""
+    return {b.key: b.action for b in AddServerScreen.BINDINGS}
 
 
 class TestAddServerScreenTwoLevelNavigation:
@@ -31,234 +120,168 @@ class TestAddServerScreenTwoLevelNavigation:
         assert hasattr(screen, "on_mount")
         assert callable(screen.on_mount)
 
-    def test_get_current_field_valid_index(self):
+    def test_get_current_field_valid_index(self, make_screen):
         """Test getting current field with valid index."""
-        screen = AddServerScreen()
-        screen.fields = [
-            {"id": "input-name", "label_id": "label-name", "type": "input"},
-            {"id": "input-host", "label_id": "label-host", "type": "input"},
-        ]
-        screen.current_field_index = 0
+        screen = make_screen()
 
         field = screen._get_current_field()
 
         assert field is not None
-        assert field["id"] == "input-name"
-        assert field["type"] == "input"
+        assert field.id == "input-name"
+        assert field.type == "input"
 
-    def test_get_current_field_invalid_index(self):
+    def test_get_current_field_invalid_index(self, make_screen):
         """Test getting current field with invalid index."""
-        screen = AddServerScreen()
-        screen.fields = [
-            {"id": "input-name", "label_id": "label-name", "type": "input"},
-        ]
-        screen.current_field_index = 10  # Out of bounds
+        screen = make_screen(idx=10)  # Out of bounds
 
         field = screen._get_current_field()
 
         assert field is None
 
-    def test_get_current_field_empty_fields(self):
+    def test_get_current_field_empty_fields(self, make_screen):
         """Test getting current field when fields list is empty."""
-        screen = AddServerScreen()
-        screen.fields = []
-        screen.current_field_index = 0
+        screen = make_screen(fields=())
 
         field = screen._get_current_field()
 
         assert field is None
 
-    def test_action_navigate_down_in_navigation_mode(self):
-        """Test navigating down in navigation mode."""
-        screen = AddServerScreen()
-        screen.fields = [
-            {"id": "input-name", "label_id": "label-name", "type": "input"},
-            {"id": "input-host", "label_id": "label-host", "type": "input"},
-        ]
-        screen.current_field_index = 0
-        screen.in_edit_mode = False
-        screen._update_field_highlights = Mock()
-
-        screen.action_navigate_down()
+    @pytest.mark.parametrize(
+        ("action", "start_idx", "edit_mode", "expected_idx"),
+        [
+            pytest.param("action_navigate_down", 0, False, 1, id="down"),
+            pytest.param("action_navigate_down", 0, True, 0, id="down-edit-mode-noop"),
+            pytest.param("action_navigate_up", 1, False, 0, id="up"),
+            pytest.param("action_navigate_up", 1, True, 1, id="up-edit-mode-noop"),
+            pytest.param("action_navigate_down", 1, False, 0, id="down-wraps-at-end"),
+            pytest.param("action_navigate_up", 0, False, 1, id="up-wraps-at-start"),
+        ],
+    )
+    def test_navigation(self, make_screen, action, start_idx, edit_mode, expected_idx):
+        """Test up/down navigation, wrapping, and that edit mode keeps arrows for editing."""
+        screen = make_screen(idx=start_idx, edit=edit_mode)
+
+        getattr(screen, action)()
+
+        assert screen.current_field_index == expected_idx
+        assert screen._update_field_highlights.called is not edit_mode
+
+    @pytest.mark.parametrize(
+        ("auth_method", "start_idx", "expected_idx"),
+        [
+            pytest.param("key", 1, 3, id="key-skips-password"),
+            pytest.param("password", 0, 2, id="password-skips-keypath"),
+        ],
+    )
+    def test_navigation_skips_hidden_auth_fields(self, make_screen, auth_method, start_idx, expected_idx):
+        """Test that navigation skips the field belonging to the other auth method."""
+        screen = make_screen(fields=FIELDS_AUTH, idx=start_idx, auth=auth_method)
 
-        assert screen.current_field_index == 1
-        screen._update_field_highlights.assert_called()
-
-    def test_action_navigate_down_in_edit_mode_does_nothing(self):
-        """Test that navigating down in edit mode does nothing."""
-        screen = AddServerScreen()
-        screen.fields = [
-            {"id": "input-name", "label_id": "label-name", "type": "input"},
-            {"id": "input-host", "label_id": "label-host", "type": "input"},
-        ]
-        screen.current_field_index = 0
-        screen.in_edit_mode = True
-
-        screen.action_navigate_down()
-
-        # Should stay at same index when in edit mode
-        assert screen.current_field_index == 0
-
-    def test_action_navigate_up_in_navigation_mode(self):
-        """Test navigating up in navigation mode."""
-        screen = AddServerScreen()
-        screen.fields = [
-            {"id": "input-name", "label_id": "label-name", "type": "input"},
-            {"id": "input-host", "label_id": "label-host", "type": "input"},
-        ]
-        screen.current_field_index = 1
-        screen.in_edit_mode = False
-        screen._update_field_highlights = Mock()
-
-        screen.action_navigate_up()
+        screen._navigate_to_next_valid_field()
 
-        assert screen.current_field_index == 0
-        screen._update_field_highlights.assert_called()
+        assert screen.current_field_index == expected_idx
 
-    def test_action_navigate_up_in_edit_mode_does_nothing(self):
-        """Test that navigating up in edit mode does nothing."""
-        screen = AddServerScreen()
-        screen.fields = [
-            {"id": "input-name", "label_id": "label-name", "type": "input"},
-            {"id": "input-host", "label_id": "label-host", "type": "input"},
-        ]
-        screen.current_field_index = 1
-        screen.in_edit_mode = True
+    @pytest.mark.parametrize(
+        ("action", "start_idx", "expected_idx"),
+        [
+            pytest.param("action_navigate_right", 1, 2, id="right-add-to-cancel"),
+            pytest.param("action_navigate_left", 2, 1, id="left-cancel-to-add"),
+            pytest.param("action_navigate_down", 1, 0, id="down-from-add-skips-cancel"),
+            pytest.param("action_navigate_up", 2, 0, id="up-from-cancel-skips-add"),
+        ],
+    )
+    def test_button_row_navigation(self, make_screen, action, start_idx, expected_idx):
+        """Test that Add/Cancel share a row: left/right move between them, up/down leave the row."""
+        screen = make_screen(fields=FIELDS_BUTTONS, idx=start_idx)
 
-        screen.action_navigate_up()
+        getattr(screen, action)()
 
-        # Should stay at same index when in edit mode
-        assert screen.current_field_index == 1
+        assert screen.current_field_index == expected_idx
 
-    def test_action_enter_field_from_navigation_mode(self):
+    def test_action_enter_field_from_navigation_mode(self, make_screen):
         """Test entering a field from navigation mode."""
-        screen = AddServerScreen()
-        screen.fields = [
-            {"id": "input-name", "label_id": "label-name", "type": "input"},
-        ]
-        screen.current_field_index = 0
-        screen.in_edit_mode = False
+        screen = make_screen()
 
         # Before entering
         assert screen.in_edit_mode is False
 
-    def test_action_enter_field_when_already_in_edit_mode(self):
+    def test_action_enter_field_when_already_in_edit_mode(self, make_screen):
         """Test that pressing enter when in edit mode exits the field."""
-        screen = AddServerScreen()
-        screen.fields = [
-            {"id": "input-name", "label_id": "label-name", "type": "input"},
-        ]
-        screen.current_field_index = 0
-        screen.in_edit_mode = True
+        screen = make_screen(edit=True)
         screen.action_exit_field = Mock()
 
         screen.action_enter_field()
 
         screen.action_exit_field.assert_called_once()
 
-    def test_action_exit_field_when_not_in_edit_mode(self):
+    def test_action_exit_field_when_not_in_edit_mode(self, make_screen):
         """Test that exiting field when not in edit mode does nothing."""
-        screen = AddServerScreen()
-        screen.in_edit_mode = False
-        screen._update_field_highlights = Mock()
+        screen = make_screen()
 
         screen.action_exit_field()
 
         # Should not update highlights if not in edit mode
         screen._update_field_highlights.assert_not_called()
 
-    def test_action_exit_field_transitions_to_navigation_mode(self):
+    def test_action_exit_field_transitions_to_navigation_mode(self, make_screen):
         """Test that exiting field transitions to navigation mode."""
-        screen = AddServerScreen()
-        screen.fields = [
-            {"id": "input-name", "label_id": "label-name", "type": "input"},
-        ]
-        screen.current_field_index = 0
-        screen.in_edit_mode = True
+        screen = make_screen(edit=True)
+        name_input = FakeInput()
+        screen._inputs = {"input-name": name_input}
+        screen.focus = Mock()
 
-        # Mock the widget and its methods
-        with patch.object(screen, "query_one") as mock_query:
-            mock_input = Mock(spec=Input)
-            mock_query.return_value = mock_input
-            screen.focus = Mock()
-            screen._update_field_highlights = Mock()
+        screen.action_exit_field()
 
-            screen.action_exit_field()
+        # Should transition to navigation mode and hand focus back to the screen
+        assert screen.in_edit_mode is False
+        assert name_input.disabled is True
+        assert name_input.blur_count == 1
+        screen.focus.assert_called_once()
 
-            # Should transition to navigation mode
-            assert screen.in_edit_mode is False
-            mock_input.disabled = True
-            screen.focus.assert_called_once()
+    def test_navigate_to_same_field_skips_highlight_update(self, make_screen):
+        """Test that wrapping back onto the only visible field does not redraw highlights."""
+        screen = make_screen(fields=(_NAME, _PASSWORD), auth="key")
 
-    def test_navigate_wraps_around_at_end(self):
-        """Test that navigation wraps around at the end of field list."""
-        screen = AddServerScreen()
-        screen.fields = [
-            {"id": "input-name", "label_id": "label-name", "type": "input"},
-            {"id": "input-host", "label_id": "label-host", "type": "input"},
-        ]
-        screen.current_field_index = 1  # Last field
-        screen.in_edit_mode = False
-        screen._update_field_highlights = Mock()
-
-        screen.action_navigate_down()
+        screen._navigate_to_next_valid_field()
 
-        # Should wrap to first field
         assert screen.current_field_index == 0
+        screen._update_field_highlights.assert_not_called()
 
-    def test_navigate_wraps_around_at_start(self):
-        """Test that navigation wraps around at the start of field list."""
-        screen = AddServerScreen()
-        screen.fields = [
-            {"id": "input-name", "label_id": "label-name", "type": "input"},
-            {"id": "input-host", "label_id": "label-host", "type": "input"},
-        ]
-        screen.current_field_index = 0  # First field
-        screen.in_edit_mode = False
-        screen._update_field_highlights = Mock()
-
-        screen.action_navigate_up()
-
-        # Should wrap to last field
-        assert screen.current_field_index == 1
-
-    def test_skip_hidden_fields_based_on_auth_method_key(self):
-        """Test that navigation skips password field when auth method is key."""
+    def test_update_field_highlights_skips_when_state_unchanged(self):
+        """Test that highlights are not redrawn for the same field and mode."""
         screen = AddServerScreen()
-        screen.auth_method = "key"
-        screen.fields = [
-            {"id": "input-name", "label_id": "label-name", "type": "input"},
-            {"id": "input-keypath", "label_id": "label-keypath", "type": "input", "auth_type": "key"},
-            {"id": "input-password", "label_id": "label-password", "type": "input", "auth_type": "password"},
-            {"id": "add-btn", "label_id": None, "type": "button"},
-        ]
-        screen.current_field_index = 1  # On keypath field
+        screen.fields = (_NAME,)
+        screen.current_field_index = 0
         screen.in_edit_mode = False
-        screen._update_field_highlights = Mock()
+        screen._highlight_state = ("input-name", False)
+        screen.query_one = Mock()
 
-        screen._navigate_to_next_valid_field()
+        screen._update_field_highlights()
 
-        # Should skip password field and go to button
-        assert screen.current_field_index == 3
+        screen.query_one.assert_not_called()
 
-    def test_skip_hidden_fields_based_on_auth_method_password(self):
-        """Test that navigation skips key field when auth method is password."""
+    def test_update_field_highlights_skips_scroll_when_field_visible(self):
+        """Test that a field already inside the scroll viewport is not scrolled to."""
         screen = AddServerScreen()
-        screen.auth_method = "password"
-        screen.fields = [
-            {"id": "input-name", "label_id": "label-name", "type": "input"},
-            {"id": "input-keypath", "label_id": "label-keypath", "type": "input", "auth_type": "key"},
-            {"id": "input-password", "label_id": "label-password", "type": "input", "auth_type": "password"},
-            {"id": "add-btn", "label_id": None, "type": "button"},
-        ]
-        screen.current_field_index = 0  # On name field
+        screen.fields = (_NAME,)
+        screen.current_field_index = 0
         screen.in_edit_mode = False
-        screen._update_field_highlights = Mock()
-
-        screen._navigate_to_next_valid_field()
-
-        # Should skip keypath field and go to password
-        assert screen.current_field_index == 2
+        name_input = Mock()
+        screen._labels = {"label-name": Mock()}
+        screen._buttons = {"add-btn": Mock(), "cancel-btn": Mock()}
+        screen._inputs = {"input-name": name_input}
+        screen._fields_scroll = Mock()
+
+        # Visible: no scroll
+        screen._fields_scroll.content_region.contains_region.return_value = True
+        screen._update_field_highlights()
+        name_input.parent.scroll_visible.assert_not_called()
+
+        # Out of view: scroll
+        screen._highlight_state = None
+        screen._fields_scroll.content_region.contains_region.return_value = False
+        screen._update_field_highlights()
+        name_input.parent.scroll_visible.assert_called_once_with(animate=False)
 
     def test_auth_method_change_updates_visible_fields(self):
         """Test that changing auth method updates visible fields."""
@@ -266,161 +289,81 @@ class TestAddServerScreenTwoLevelNavigation:
         screen.auth_method = "key"
 
         # Mock the containers
-        with patch.object(screen, "query_one") as mock_query:
-            mock_key_container = Mock()
-            mock_password_container = Mock()
-
-            def side_effect(selector):
-                if selector == "#key-container":
-                    return mock_key_container
-                if selector == "#password-container":
-                    return mock_password_container
-                return Mock()
-
-            mock_query.side_effect = side_effect
-
-            # Change to password
-            screen.auth_method = "password"
-            screen._update_auth_fields()
-
-            # Key container should be hidden, password shown
-            mock_key_container.add_class.assert_called_with("hidden")
-            mock_password_container.remove_class.assert_called_with("hidden")
-
-    def test_bindings_include_all_navigation_keys(self):
-        """Test that all required key bindings are present."""
-        screen = AddServerScreen()
-
-        binding_keys = [b.key for b in screen.BINDINGS]
-
-        assert "up" in binding_keys
-        assert "down" in binding_keys
-        assert "enter" in binding_keys
-        assert "right" in binding_keys
-        assert "left" in binding_keys
-        assert "escape" in binding_keys
-        assert "ctrl+s" in binding_keys
-
-    def test_bindings_map_to_correct_actions(self):
-        """Test that key bindings map to correct actions."""
-        screen = AddServerScreen()
-
-        bindings = {b.key: b.action for b in screen.BINDINGS}
-
-        assert bindings["up"] == "navigate_up"
-        assert bindings["down"] == "navigate_down"
-        assert bindings["enter"] == "enter_field"
-        assert bindings["right"] == "navigate_right"
-        assert bindings["left"] == "navigate_left"
-        assert bindings["escape"] == "cancel"
-        assert bindings["ctrl+s"] == "submit"
-
-    def test_action_navigate_right_transitions_add_to_cancel(self):
-        """Test that right arrow on Add Server button moves to Cancel button."""
-        screen = AddServerScreen()
-        screen.fields = [
-            {"id": "add-btn", "label_id": None, "type": "button"},
-            {"id": "cancel-btn", "label_id": None, "type": "button"},
-        ]
-        screen.current_field_index = 0  # On add-btn
+        mock_key_container = Mock()
+        mock_password_container = Mock()
+        screen._key_container = mock_key_container
+        screen._password_container = mock_password_container
 
-        # Mock highlight update methods
-        screen._update_field_highlights = Mock()
-        screen.in_edit_mode = False
-
-        screen.action_navigate_right()
-
-        assert screen.current_field_index == 1  # Should move to cancel-btn
-
-    def test_action_navigate_left_transitions_cancel_to_add(self):
-        """Test that left arrow on Cancel button moves to Add Server button."""
-        screen = AddServerScreen()
-        screen.fields = [
-            {"id": "add-btn", "label_id": None, "type": "button"},
-            {"id": "cancel-btn", "label_id": None, "type": "button"},
-        ]
-        screen.current_field_index = 1  # On cancel-btn
-
-        # Mock highlight update methods
-        screen._update_field_highlights = Mock()
-        screen.in_edit_mode = False
-
-        screen.action_navigate_left()
-
-        assert screen.current_field_index == 0  # Should move to add-btn
-
-    def test_action_navigate_down_skips_cancel_from_add(self):
-        """Test that down arrow from Add Server button skips Cancel button."""
-        screen = AddServerScreen()
-        screen.fields = [
-            {"id": "input-name", "label_id": "label-name", "type": "input"},
-            {"id": "add-btn", "label_id": None, "type": "button"},
-            {"id": "cancel-btn", "label_id": None, "type": "button"},
-        ]
-        screen.current_field_index = 1  # On add-btn
-
-        # Mock highlight update methods
-        screen._update_field_highlights = Mock()
-        screen.in_edit_mode = False
-
-        screen.action_navigate_down()
+        # Change to password
+        screen.auth_method = "password"
+        screen._update_auth_fields()
 
-        assert screen.current_field_index == 0  # Should wrap to input-name
+        # Key container should be hidden, password shown
+        mock_key_container.add_class.assert_called_with("hidden")
+        mock_password_container.remove_class.assert_called_with("hidden")
 
-    def test_action_navigate_up_skips_add_from_cancel(self):
-        """Test that up arrow from Cancel button skips Add Server button."""
+    def test_auth_fields_fall_back_to_query_one_before_mount(self):
+        """Test that the key container is queried when no cached reference exists."""
         screen = AddServerScreen()
-        screen.fields = [
-            {"id": "input-name", "label_id": "label-name", "type": "input"},
-            {"id": "add-btn", "label_id": None, "type": "button"},
-            {"id": "cancel-btn", "label_id": None, "type": "button"},
-        ]
-        screen.current_field_index = 2  # On cancel-btn
-
-        # Mock highlight update methods
-        screen._update_field_highlights = Mock()
-        screen.in_edit_mode = False
-
-        screen.action_navigate_up()
+        screen.auth_method = "key"
+        mock_key_container = Mock()
+        screen.query_one = stub_query_one({"#key-container": mock_key_container})
 
-        assert screen.current_field_index == 0  # Should go to input-name
+        screen._update_auth_fields()
 
-    def test_action_methods_exist(self):
-        """Test that all required action methods exist."""
-        screen = AddServerScreen()
+        mock_key_container.remove_class.assert_called_once_with("hidden")
 
-        assert hasattr(screen, "action_navigate_up")
-        assert hasattr(screen, "action_navigate_right")
-        assert hasattr(screen, "action_navigate_left")
-        assert hasattr(screen, "action_enter_field")
-        assert hasattr(screen, "action_exit_field")
-        assert hasattr(screen, "action_cancel")
-        assert hasattr(screen, "action_submit")
-
-        assert callable(screen.action_navigate_up)
-        assert callable(screen.action_navigate_down)
-        assert callable(screen.action_navigate_right)
-        assert callable(screen.action_navigate_left)
-        assert callable(screen.action_enter_field)
-        assert callable(screen.action_exit_field)
-        assert callable(screen.action_cancel)
-        assert callable(screen.action_submit)
-
-    def test_helper_methods_exist(self):
-        """Test that all required helper methods exist."""
+    def test_password_container_mounted_on_first_switch(self):
+        """Test that the password field is only mounted when password auth is chosen."""
         screen = AddServerScreen()
+        screen._key_container = Mock()
+        screen._labels = {}
+        screen._inputs = {}
 
-        assert hasattr(screen, "_get_current_field")
-        assert hasattr(screen, "_update_field_highlights")
-        assert hasattr(screen, "_navigate_to_next_valid_field")
-        assert hasattr(screen, "_navigate_to_prev_valid_field")
-        assert hasattr(screen, "_update_auth_fields")
+        # Key auth never builds the password widgets
+        screen._update_auth_fields()
+        assert screen._password_container is None
+        screen._key_container.parent.mount.assert_not_called()
 
-        assert callable(screen._get_current_field)
-        assert callable(screen._update_field_highlights)
-        assert callable(screen._navigate_to_next_valid_field)
-        assert callable(screen._navigate_to_prev_valid_field)
-        assert callable(screen._update_auth_fields)
+        # First switch to password mounts it after the key container and caches it
+        screen.auth_method = "password"
+        screen._update_auth_fields()
+        password_container = screen._password_container
+        assert password_container is not None
+        screen._key_container.parent.mount.assert_called_once_with(
+            password_container, after=screen._key_container
+        )
+        assert "input-password" in screen._inputs
+        assert "label-password" in screen._labels
+
+        # Switching back and forth reuses the mounted container
+        screen.auth_method = "key"
+        screen._update_auth_fields()
+        screen.auth_method = "password"
+        screen._update_auth_fields()
+        assert screen._password_container is password_container
+        screen._key_container.parent.mount.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("key", "action"),
+        [
+            ("up", "navigate_up"),
+            ("down", "navigate_down"),
+            ("enter", "enter_field"),
+            ("right", "navigate_right"),
+            ("left", "navigate_left"),
+            ("escape", "cancel"),
+            ("ctrl+s", "submit"),
+        ],
+    )
+    def test_binding(self, bindings_map, key, action):
+        """Test that each required key is bound to the correct action."""
+        assert bindings_map[key] == action
+
+    @pytest.mark.parametrize("name", METHOD_NAMES)
+    def test_method_exists(self, shared_screen, name):
+        """Test that each required action and helper method exists and is callable."""
+        assert callable(getattr(shared_screen, name, None))
 
     def test_on_input_submitted_exits_field_in_edit_mode(self):
         """Test that pressing Enter in an input field exits edit mode."""
@@ -428,16 +371,13 @@ class TestAddServerScreenTwoLevelNavigation:
         screen.in_edit_mode = True
         screen.action_exit_field = Mock()
 
-        # Create a mock event
-        mock_input = Mock(spec=Input)
-        mock_event = Mock()
-        mock_event.input = mock_input
-        mock_event.stop = Mock()
+        stopped = []
+        event = SimpleNamespace(input=FakeInput(), stop=lambda: stopped.append(True))
 
-        screen.on_input_submitted(mock_event)
+        screen.on_input_submitted(event)
 
         screen.action_exit_field.assert_called_once()
-        mock_event.stop.assert_called_once()
+        assert stopped == [True]
 
     def test_on_input_submitted_does_nothing_in_navigation_mode(self):
         """Test that input submitted event does nothing in navigation mode."""
@@ -445,13 +385,14 @@ class TestAddServerScreenTwoLevelNavigation:
         screen.in_edit_mode = False
         screen.action_exit_field = Mock()
 
-        mock_event = Mock()
-        mock_event.stop = Mock()
+        stopped = []
+        event = SimpleNamespace(input=FakeInput(), stop=lambda: stopped.append(True))
 
-        screen.on_input_submitted(mock_event)
+        screen.on_input_submitted(event)
 
         # Should not call action_exit_field when not in edit mode
         screen.action_exit_field.assert_not_called()
+        assert stopped == []
 
 
 class TestAddServerScreenValidation:
@@ -463,23 +404,71 @@ class TestAddServerScreenValidation:
         screen.notify = Mock()
         screen.dismiss = Mock()
 
-        # Mock query_one to return inputs with empty values
-        with patch.object(screen, "query_one") as mock_query:
-            def side_effect(selector, widget_type=None):
-                mock = Mock(spec=Input)
-                # Create a mock that has a value attribute that returns empty string
-                mock.value = ""  # This will call .strip() on the string itself
-                mock.focus = Mock()
-                return mock
+        # Cached inputs with empty values (normally populated in on_mount)
+        screen._inputs = {
+            input_id: FakeInput()
+            for input_id in ("input-name", "input-host", "input-username", "input-keypath", "input-password")
+        }
+        screen.query_one = Mock()
+
+        screen._submit()
+
+        # Should notify about missing name
+        assert screen.notify.called, "Should notify user about missing name"
+        # Should not dismiss if validation failed
+        screen.dismiss.assert_not_called()
+        # Should focus the cached name input without querying the DOM
+        assert screen._inputs["input-name"].focus_count == 1
+        screen.query_one.assert_not_called()
+
+    def test_submit_with_invalid_host_focuses_host(self):
+        """Test that the first invalid field in form order is reported and focused."""
+        screen = AddServerScreen()
+        screen.notify = Mock()
+        screen.dismiss = Mock()
+        values = {"input-name": "srv", "input-host": "bad host!", "input-username": ""}
+        screen._inputs = {input_id: FakeInput(value) for input_id, value in values.items()}
+
+        screen._submit()
 
-            mock_query.side_effect = side_effect
+        assert screen.notify.call_args.kwargs["severity"] == "error"
+        assert screen._inputs["input-host"].focus_count == 1
+        assert screen._inputs["input-username"].focus_count == 0
+        screen.dismiss.assert_not_called()
 
-            screen._submit()
+    def test_input_changed_debounces_validation(self):
+        """Test that each keystroke restarts a single pending validation timer."""
+        screen = AddServerScreen()
+        first_timer = Mock()
+        second_timer = Mock()
+        screen.set_timer = Mock(side_effect=[first_timer, second_timer])
+
+        screen.on_input_changed(Mock())
+        screen.on_input_changed(Mock())
 
-            # Should notify about missing name
-            assert screen.notify.called, "Should notify user about missing name"
-            # Should not dismiss if validation failed
-            screen.dismiss.assert_not_called()
+        first_timer.stop.assert_called_once()
+        assert screen._validate_timer is second_timer
+        screen.set_timer.assert_called_with(screen.VALIDATION_DEBOUNCE, screen._run_validation)
+
+    def test_run_validation_updates_help_text(self):
+        """Test that live validation shows errors and restores help text."""
+        screen = AddServerScreen()
+        screen._inputs = {
+            "input-name": FakeInput("Server 1"),
+            "input-host": FakeInput("-bad-host"),
+            "input-username": FakeInput(""),
+        }
+        screen._help_labels = {help_id: Mock() for help_id in screen.HELP_TEXTS}
+
+        screen._run_validation()
+
+        host_label = screen._help_labels["help-host"]
+        host_label.add_class.assert_called_once_with("invalid")
+        name_label = screen._help_labels["help-name"]
+        name_label.update.assert_called_once_with(screen.HELP_TEXTS["help-name"])
+        name_label.remove_class.assert_called_once_with("invalid")
+        # Empty fields are left to submit-time validation
+        screen._help_labels["help-username"].add_class.assert_not_called()
 
     def test_action_cancel_dismisses_with_none(self):
         """Test that cancel action dismisses with None."""
@@ -1,6 +1,8 @@
 """Tests for concurrent operations in monitoring."""
 
 import asyncio
+from functools import partial
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -8,47 +10,97 @@ from src.monitor import CPUMonitor
 from src.ssh_client import ServerConfig, SSHClient
 
 
-@pytest.mark.asyncio
-class TestConcurrentOperations:
-    """Test concurrent operations in monitor."""
+# Upper bound when waiting for a monitor loop to reach its first poll
+POLL_TIMEOUT = 0.5
 
-    async def test_concurrent_metric_collection(self):
-        """Test that concurrent metric collection is handled properly."""
-        config = ServerConfig(
-            name="concurrent-test",
-            host="192.0.2.1",
-            username="testuser",
-            auth_method="password",
-            password="testpass",
-        )
 
-        client = SSHClient(config, connection_timeout=1, max_retries=1, retry_delay=0)
-        monitor = CPUMonitor(client, poll_interval=0.1, history_window=10)
+def signal_polls(monkeypatch, client: SSHClient, polls: int = 1) -> asyncio.Event:
+    """Make the client's connection check report offline and signal the first polls.
 
-        # Try to get metrics concurrently (should be protected by internal logic)
-        tasks = [monitor.get_metrics() for _ in range(10)]
-        metrics_list = await asyncio.gather(*tasks, return_exceptions=True)
+    Each monitor loop iteration starts with ensure_connected(), so the returned
+    event is set once `polls` iterations have started. Reporting offline keeps
+    the loop away from the network.
 
-        # All should return None (no metrics yet) or metrics, but no exceptions
-        assert not any(isinstance(m, Exception) for m in metrics_list)
+    Args:
+        monkeypatch: pytest monkeypatch fixture
+        client: SSH client shared by the monitors under test
+        polls: Number of loop iterations to wait for
+
+    Returns:
+        Event set after the requested number of polls
+    """
+    polled = asyncio.Event()
+    calls = 0
+
+    async def ensure_connected() -> bool:
+        nonlocal calls
+        calls += 1
+        if calls >= polls:
+            polled.set()
+        return False
+
+    monkeypatch.setattr(client, "ensure_connected", ensure_connected)
+    return polled
+
+
+@pytest.fixture(scope="module")
+def server_config():
+    """Create a server configuration shared by the module (never mutated)."""
+    return ServerConfig(
+        name="concurrent-test",
+        host="192.0.2.1",
+        username="testuser",
+        auth_method="password",
+        password="testpass",
+    )
+
+
+@pytest.fixture
+def ssh_client(server_config):
+    """Create a fresh SSH client for an unreachable TEST-NET host."""
+    return SSHClient(server_config, connection_timeout=1, max_retries=1, retry_delay=0)
 
-    async def test_start_stop_concurrent_calls(self):
-        """Test concurrent start/stop calls don't cause issues."""
-        config = ServerConfig(
-            name="start-stop-test",
-            host="192.0.2.1",
-            username="testuser",
-            auth_method="password",
-            password="testpass",
-        )
 
-        client = SSHClient(config, connection_timeout=1, max_retries=1, retry_delay=0)
-        monitor = CPUMonitor(client, poll_interval=0.5, history_window=10)
+@pytest.mark.asyncio(loop_scope="module")
+class TestConcurrentOperations:
+    """Test concurrent operations in monitor."""
+
+    @pytest.mark.parametrize(
+        ("operation", "n"),
+        [
+            pytest.param("get_metrics", 3, id="metrics-small"),
+            pytest.param("cat /proc/stat", 3, id="cat-stat"),
+            pytest.param("uptime", 3, id="uptime"),
+            pytest.param("get_metrics", 50, id="metrics-large", marks=pytest.mark.slow),
+        ],
+    )
+    async def test_fanout_no_exceptions(self, ssh_client, operation, n):
+        """Test that n concurrent metric reads or commands all complete without errors.
+
+        get_metrics is served from the monitor's lock; any other operation is run
+        as a command through the client's lock, which returns None while offline.
+        """
+        if operation == "get_metrics":
+            call = CPUMonitor(ssh_client, poll_interval=0.1, history_window=10).get_metrics
+        else:
+            call = partial(ssh_client.execute_command, operation)
+
+        # TaskGroup re-raises the first failure, so completing the block means no call raised
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(call()) for _ in range(n)]
+
+        # Nothing has been collected or connected yet, so every call yields None
+        assert [t.result() for t in tasks] == [None] * n
+
+    async def test_start_stop_concurrent_calls(self, ssh_client, monkeypatch):
+        """Test concurrent start/stop calls don't cause issues."""
+        monitor = CPUMonitor(ssh_client, poll_interval=0.5, history_window=10)
+        polled = signal_polls(monkeypatch, ssh_client)
 
         # Start multiple times concurrently
         start_tasks = [asyncio.create_task(monitor.start()) for _ in range(3)]
 
-        await asyncio.sleep(0.5)
+        await asyncio.wait_for(polled.wait(), timeout=POLL_TIMEOUT)
 
         # Stop multiple times concurrently
         stop_tasks = [asyncio.create_task(monitor.stop()) for _ in range(3)]
@@ -56,53 +108,39 @@ class TestConcurrentOperations:
         # All should complete without errors
         await asyncio.gather(*start_tasks, *stop_tasks, return_exceptions=False)
 
-    async def test_history_access_during_updates(self):
+    async def test_history_access_during_updates(self, ssh_client, monkeypatch):
         """Test accessing history while it's being updated."""
-        config = ServerConfig(
-            name="history-test",
-            host="192.0.2.1",
-            username="testuser",
-            auth_method="password",
-            password="testpass",
-        )
-
-        client = SSHClient(config, connection_timeout=1, max_retries=1, retry_delay=0)
-        monitor = CPUMonitor(client, poll_interval=0.1, history_window=10)
+        monitor = CPUMonitor(ssh_client, poll_interval=0.1, history_window=10)
+        polled = signal_polls(monkeypatch, ssh_client)
 
         # Start monitoring task
         monitor_task = asyncio.create_task(monitor.start())
+        await asyncio.wait_for(polled.wait(), timeout=POLL_TIMEOUT)
 
-        # Repeatedly access history while monitoring is running
+        # Repeatedly access history while monitoring is running, yielding to the
+        # loop between reads; the invariant does not depend on time passing
         for _ in range(20):
             history = await monitor.get_cpu_history()
             assert isinstance(history, list)
-            await asyncio.sleep(0.05)
+            await asyncio.sleep(0)
 
         # Stop monitoring
         await monitor.stop()
         await monitor_task
 
-    async def test_multiple_monitors_same_client(self):
+    async def test_multiple_monitors_same_client(self, ssh_client, monkeypatch):
         """Test that multiple monitors with same client don't interfere."""
-        config = ServerConfig(
-            name="multi-monitor-test",
-            host="192.0.2.1",
-            username="testuser",
-            auth_method="password",
-            password="testpass",
-        )
-
-        client = SSHClient(config, connection_timeout=1, max_retries=1, retry_delay=0)
+        polled = signal_polls(monkeypatch, ssh_client, polls=2)
 
         # Create multiple monitors (though unusual, should be handled)
-        monitor1 = CPUMonitor(client, poll_interval=0.2, history_window=10)
-        monitor2 = CPUMonitor(client, poll_interval=0.3, history_window=10)
+        monitor1 = CPUMonitor(ssh_client, poll_interval=0.2, history_window=10)
+        monitor2 = CPUMonitor(ssh_client, poll_interval=0.3, history_window=10)
 
-        # Start both
+        # Start both, and wait until both loops have polled
         task1 = asyncio.create_task(monitor1.start())
         task2 = asyncio.create_task(monitor2.start())
 
-        await asyncio.sleep(1)
+        await asyncio.wait_for(polled.wait(), timeout=POLL_TIMEOUT)
 
         # Stop both
         await monitor1.stop()
@@ -110,93 +148,36 @@ class TestConcurrentOperations:
 
         await asyncio.gather(task1, task2, return_exceptions=True)
 
-    async def test_rapid_connect_disconnect(self):
+    async def test_rapid_connect_disconnect(self, ssh_client, monkeypatch):
         """Test rapid connection and disconnection cycles."""
-        config = ServerConfig(
-            name="rapid-test",
-            host="192.0.2.1",
-            username="testuser",
-            auth_method="password",
-            password="testpass",
-        )
-
-        client = SSHClient(config, connection_timeout=1, max_retries=1, retry_delay=0)
+        # Fail the transport immediately instead of waiting on the TEST-NET host
+        mock_connect = AsyncMock(side_effect=OSError("Network unreachable"))
+        monkeypatch.setattr("src.ssh_client.asyncssh.connect", mock_connect)
 
         # Rapidly connect and disconnect
         for _ in range(5):
-            await client.connect()
-            await client.disconnect()
-
-        # Should end in disconnected state
-        assert not await client.is_connected()
-
-    async def test_concurrent_command_execution(self):
-        """Test that concurrent command execution is properly queued."""
-        config = ServerConfig(
-            name="command-test",
-            host="192.0.2.1",
-            username="testuser",
-            auth_method="password",
-            password="testpass",
-        )
-
-        client = SSHClient(config, connection_timeout=1, max_retries=1, retry_delay=0)
-
-        # Try to execute multiple commands concurrently (should be protected by lock)
-        tasks = [
-            client.execute_command("cat /proc/stat"),
-            client.execute_command("cat /proc/meminfo"),
-            client.execute_command("uptime"),
-        ]
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # All should return None (not connected), but no exceptions
-        assert all(r is None for r in results)
-        assert all(not isinstance(r, Exception) for r in results)
-
-    async def test_monitor_with_rapid_metric_requests(self):
-        """Test monitor handling rapid metric requests."""
-        config = ServerConfig(
-            name="rapid-metrics-test",
-            host="192.0.2.1",
-            username="testuser",
-            auth_method="password",
-            password="testpass",
-        )
-
-        client = SSHClient(config, connection_timeout=1, max_retries=1, retry_delay=0)
-        monitor = CPUMonitor(client, poll_interval=0.5, history_window=10)
-
-        # Request metrics rapidly
-        tasks = [monitor.get_metrics() for _ in range(50)]
-        metrics_list = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # All should complete successfully
-        assert len(metrics_list) == 50
-        assert all(not isinstance(m, Exception) for m in metrics_list)
-
-    async def test_cleanup_during_active_monitoring(self):
-        """Test cleanup while monitoring is active."""
-        config = ServerConfig(
-            name="cleanup-test",
-            host="192.0.2.1",
-            username="testuser",
-            auth_method="password",
-            password="testpass",
-        )
+            assert await ssh_client.connect() is False
+            assert ssh_client.status.connected is False
+            assert "Network unreachable" in ssh_client.status.error_message
+            await ssh_client.disconnect()
 
-        client = SSHClient(config, connection_timeout=1, max_retries=1, retry_delay=0)
-        monitor = CPUMonitor(client, poll_interval=0.2, history_window=10)
+        # Every cycle attempted a connection, and the client ends disconnected
+        assert mock_connect.await_count == 5
+        assert not await ssh_client.is_connected()
+
+    async def test_cleanup_during_active_monitoring(self, ssh_client, monkeypatch):
+        """Test cleanup while monitoring is active."""
+        monitor = CPUMonitor(ssh_client, poll_interval=0.2, history_window=10)
+        polled = signal_polls(monkeypatch, ssh_client)
 
         # Start monitoring
         monitor_task = asyncio.create_task(monitor.start())
 
-        await asyncio.sleep(0.3)
+        await asyncio.wait_for(polled.wait(), timeout=POLL_TIMEOUT)
 
         # Immediately stop and cleanup
         await monitor.stop()
-        await client.disconnect()
+        await ssh_client.disconnect()
 
         # Monitor task should complete without hanging
         try:
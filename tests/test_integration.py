@@ -5,7 +5,7 @@ end-to-end TUI tests.
 """
 
 import asyncio
-from unittest.mock import AsyncMock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -16,56 +16,148 @@ from src.ui import MonitoringApp, ServerWidget
 from src.ui.screens import AddServerScreen, ConfirmDeleteScreen
 
 
+SERVER_1 = {
+    "name": "Server 1",
+    "host": "192.168.1.1",
+    "username": "user1",
+    "auth_method": "key",
+    "key_path": "~/.ssh/key1",
+    "verify_host_key": False,
+}
+
+SERVER_2 = {
+    "name": "Server 2",
+    "host": "192.168.1.2",
+    "username": "user2",
+    "auth_method": "key",
+    "key_path": "~/.ssh/key2",
+    "verify_host_key": False,
+}
+
+
+async def _fake_connect_false(_self, *_args, **_kwargs):
+    """Stand in for SSHClient.connect: every connection attempt fails at once."""
+    return False
+
+
+async def _settle(pilot):
+    """Wait for the app's pending messages to be processed.
+
+    ``pilot.pause()`` with no delay also sleeps until the process looks idle,
+    which costs at least one 20 ms frame per call. A zero delay only waits for
+    the screen and its widgets to drain their message queues.
+
+    Not needed after ``pilot.press`` for MonitoringApp's own bindings: their
+    actions run synchronously and press already waits for each key to be handled.
+    """
+    await pilot.pause(0)
+
+
+@pytest.fixture(autouse=True)
+def _stub_ssh(monkeypatch):
+    """Keep every test off the network and away from stdin.
+
+    SSH connections fail at once and password prompts are answered.
+    Tests that need a different connect() patch their own client over this.
+    """
+    monkeypatch.setattr(SSHClient, "connect", _fake_connect_false)
+    monkeypatch.setattr("getpass.getpass", lambda *_args, **_kwargs: "test_password")
+
+
+@pytest.fixture(scope="class")
+def base_app():
+    """Build one loaded and initialized app for tests that only inspect it.
+
+    Monitoring is never started, so there is nothing to stop at teardown.
+    Tests that add, delete, or monitor servers build their own app.
+    """
+    app = CPUMonitoringApp.from_dict({
+        "servers": [SERVER_1],
+        "display": {"plot_style": "block"},
+    })
+    app.initialize_components()
+    return app
+
+
+@pytest.fixture(scope="module")
+async def running_app():
+    """Run one MonitoringApp for the whole module and yield ``(app, pilot)``.
+
+    Pilot tests swap their server widgets in with ``_show_servers`` instead of
+    mounting a fresh app each. Tests that quit the app run their own.
+    """
+    app = MonitoringApp(server_widgets=[])
+    async with app.run_test() as pilot:
+        yield app, pilot
+
+
+async def _show_servers(running_app, server_widgets):
+    """Reset the shared app to show only ``server_widgets``.
+
+    Closes any dialogs left open by an earlier test, replaces the mounted
+    server widgets, and selects the first one.
+
+    Returns:
+        The ``(app, pilot)`` pair, ready for the test to drive.
+    """
+    app, pilot = running_app
+    while len(app.screen_stack) > 1:
+        await app.pop_screen()
+
+    await app.main_container.remove_children()
+    app.server_widgets = server_widgets
+    app.selected_index = 0
+    await app.main_container.mount_all(server_widgets)
+    app._update_selection()
+    app._update_status_bar()
+
+    await _settle(pilot)
+    return app, pilot
+
+
 class TestIntegration:
     """Integration tests for the full application."""
 
-    @pytest.mark.asyncio
-    async def test_full_app_lifecycle(self, tmp_path):
+    async def test_full_app_lifecycle(self):
         """Test the full application lifecycle: initialize -> start -> stop."""
-        # Create a temporary config file
-        config_file = tmp_path / "test_config.yaml"
-        config_content = """
-servers:
-  - name: "Test Server"
-    host: "localhost"
-    username: "testuser"
-    auth_method: key
-    key_path: "~/.ssh/test_key"
-    verify_host_key: false
-
-monitoring:
-  poll_interval: 0.1
-  ui_refresh_interval: 0.1
-  history_window: 10
-
-display:
-  plot_style: "braille"
-"""
-        config_file.write_text(config_content)
-
         # Create app instance
-        app = CPUMonitoringApp(config_path=str(config_file))
-        app.load_config()
+        app = CPUMonitoringApp.from_dict({
+            "servers": [{
+                "name": "Test Server",
+                "host": "localhost",
+                "username": "testuser",
+                "auth_method": "key",
+                "key_path": "~/.ssh/test_key",
+                "verify_host_key": False,
+            }],
+            "monitoring": {"poll_interval": 0.1, "ui_refresh_interval": 0.1, "history_window": 10},
+            "display": {"plot_style": "braille"},
+        })
 
         # Verify config loaded correctly
         assert len(app.config["servers"]) == 1
         assert app.config["servers"][0]["name"] == "Test Server"
 
         # Initialize components
-        with patch("getpass.getpass", return_value="test_password"):
-            app.initialize_components()
+        app.initialize_components()
 
         # Verify components created
         assert len(app.ssh_clients) == 1
         assert len(app.monitors) == 1
         assert len(app.server_widgets) == 1
 
-        # Test monitoring start/stop without UI
-        with patch.object(app.ssh_clients[0], "connect", new_callable=AsyncMock, return_value=False):
+        # Test monitoring start/stop without UI; connect() is the monitor's first step
+        polled = asyncio.Event()
+
+        async def fake_connect():
+            polled.set()
+            return False
+
+        with patch.object(app.ssh_clients[0], "connect", new=fake_connect):
             await app.start_monitoring()
 
-            # Wait a bit for monitoring to run
-            await asyncio.sleep(0.3)
+            # Wait until the monitor loop has run
+            await asyncio.wait_for(polled.wait(), timeout=1.0)
 
             # Stop monitoring
             await app.stop_monitoring()
@@ -73,43 +165,18 @@ display:
         # Verify cleanup
         assert not app._running
 
-    @pytest.mark.asyncio
     async def test_add_server_integration(self, tmp_path):
         """Test adding a new server to a running configuration."""
-        config_file = tmp_path / "test_config.yaml"
-        config_content = """
-servers:
-  - name: "Server 1"
-    host: "192.168.1.1"
-    username: "user1"
-    auth_method: key
-    key_path: "~/.ssh/key1"
-    verify_host_key: false
-
-monitoring:
-  poll_interval: 0.1
-"""
-        config_file.write_text(config_content)
-
-        app = CPUMonitoringApp(config_path=str(config_file))
-        app.load_config()
-
-        with patch("getpass.getpass", return_value="test_password"):
-            app.initialize_components()
+        app = CPUMonitoringApp.from_dict({
+            "servers": [SERVER_1],
+            "monitoring": {"poll_interval": 0.1},
+        }, config_path=tmp_path / "config.yaml")
+        app.initialize_components()
 
         initial_count = len(app.ssh_clients)
 
         # Add a new server
-        new_server_config = {
-            "name": "Server 2",
-            "host": "192.168.1.2",
-            "username": "user2",
-            "auth_method": "key",
-            "key_path": "~/.ssh/key2",
-            "verify_host_key": False,
-        }
-
-        app.add_server(new_server_config)
+        app.add_server(dict(SERVER_2))
 
         # Verify server was added
         assert len(app.ssh_clients) == initial_count + 1
@@ -117,44 +184,21 @@ monitoring:
         assert len(app.server_widgets) == initial_count + 1
         assert len(app.config["servers"]) == initial_count + 1
 
-        # Cleanup
+        # add_server started a monitor for the new server, so this stop is not optional
         await app.stop_monitoring()
 
-    @pytest.mark.asyncio
     async def test_delete_server_integration(self, tmp_path):
         """Test deleting a server from a running configuration."""
-        config_file = tmp_path / "test_config.yaml"
-        config_content = """
-servers:
-  - name: "Server 1"
-    host: "192.168.1.1"
-    username: "user1"
-    auth_method: key
-    key_path: "~/.ssh/key1"
-    verify_host_key: false
-  - name: "Server 2"
-    host: "192.168.1.2"
-    username: "user2"
-    auth_method: key
-    key_path: "~/.ssh/key2"
-    verify_host_key: false
-
-monitoring:
-  poll_interval: 0.1
-"""
-        config_file.write_text(config_content)
-
-        app = CPUMonitoringApp(config_path=str(config_file))
-        app.load_config()
-
-        with patch("getpass.getpass", return_value="test_password"):
-            app.initialize_components()
+        app = CPUMonitoringApp.from_dict({
+            "servers": [SERVER_1, SERVER_2],
+            "monitoring": {"poll_interval": 0.1},
+        }, config_path=tmp_path / "config.yaml")
+        app.initialize_components()
 
         initial_count = len(app.ssh_clients)
 
         # Start monitoring
-        with patch.object(SSHClient, "connect", new_callable=AsyncMock, return_value=False):
-            await app.start_monitoring()
+        await app.start_monitoring()
 
         # Delete a server
         app.delete_server("Server 1")
@@ -165,13 +209,12 @@ monitoring:
         assert len(app.server_widgets) == initial_count - 1
         assert len(app.config["servers"]) == initial_count - 1
 
-        # Wait for cleanup tasks to complete
-        await asyncio.sleep(0.2)
+        # Wait for exactly the scheduled cleanup, not a guessed delay
+        await asyncio.wait_for(asyncio.gather(*app._cleanup_tasks), timeout=1.0)
 
         # Cleanup
         await app.stop_monitoring()
 
-    @pytest.mark.asyncio
     async def test_consecutive_failures_handling(self):
         """Test that consecutive failures are properly tracked and handled."""
         config = ServerConfig(
@@ -184,7 +227,8 @@ monitoring:
         )
 
         ssh_client = SSHClient(config=config, connection_timeout=0.1, max_retries=1, retry_delay=0.1)
-        monitor = CPUMonitor(ssh_client=ssh_client, poll_interval=0.05, history_window=10)
+        # A zero poll interval makes each sleep a bare yield, so the loop runs without waiting
+        monitor = CPUMonitor(ssh_client=ssh_client, poll_interval=0, history_window=10)
 
         # Mock ensure_connected to always fail and set error status
         async def mock_ensure_connected():
@@ -194,10 +238,8 @@ monitoring:
         with patch.object(ssh_client, "ensure_connected", new=mock_ensure_connected):
             await monitor.start()
 
-            # Wait for max_consecutive_failures iterations
-            # max_consecutive_failures = 10, poll_interval = 0.05
-            # Should stop after ~0.5 seconds
-            await asyncio.sleep(1.0)
+            # The loop task ends on its own after max_consecutive_failures (10) polls
+            await asyncio.wait_for(monitor._task, timeout=1.0)
 
             # Monitor should have stopped itself due to consecutive failures
             metrics = await monitor.get_metrics()
@@ -210,33 +252,16 @@ monitoring:
 
         await monitor.stop()
 
-    @pytest.mark.asyncio
     async def test_cleanup_tasks_completion(self, tmp_path):
         """Test that cleanup tasks complete properly before shutdown."""
-        config_file = tmp_path / "test_config.yaml"
-        config_content = """
-servers:
-  - name: "Server 1"
-    host: "192.168.1.1"
-    username: "user1"
-    auth_method: key
-    key_path: "~/.ssh/key1"
-    verify_host_key: false
-
-monitoring:
-  poll_interval: 0.1
-"""
-        config_file.write_text(config_content)
-
-        app = CPUMonitoringApp(config_path=str(config_file))
-        app.load_config()
+        app = CPUMonitoringApp.from_dict({
+            "servers": [SERVER_1],
+            "monitoring": {"poll_interval": 0.1},
+        }, config_path=tmp_path / "config.yaml")
+        app.initialize_components()
 
-        with patch("getpass.getpass", return_value="test_password"):
-            app.initialize_components()
-
-        # Mock SSH connect to avoid actual connection
-        with patch.object(SSHClient, "connect", new_callable=AsyncMock, return_value=False):
-            await app.start_monitoring()
+        # Start monitoring
+        await app.start_monitoring()
 
         # Delete server (creates cleanup task)
         app.delete_server("Server 1")
@@ -250,38 +275,12 @@ monitoring:
         # Verify cleanup tasks were completed and cleared
         assert len(app._cleanup_tasks) == 0
 
-    @pytest.mark.asyncio
-    async def test_config_plot_style_respected(self, tmp_path):
+    def test_config_plot_style_respected(self, base_app):
         """Test that plot_style from config is properly used."""
-        config_file = tmp_path / "test_config.yaml"
-        config_content = """
-servers:
-  - name: "Server 1"
-    host: "192.168.1.1"
-    username: "user1"
-    auth_method: key
-    key_path: "~/.ssh/key1"
-    verify_host_key: false
-
-display:
-  plot_style: "block"
-"""
-        config_file.write_text(config_content)
-
-        app = CPUMonitoringApp(config_path=str(config_file))
-        app.load_config()
-
-        with patch("getpass.getpass", return_value="test_password"):
-            app.initialize_components()
-
-        # Verify plot_style was used from config
-        widget = app.server_widgets[0]
+        widget = base_app.server_widgets[0]
         assert widget.plot_style == "block"
 
-        await app.stop_monitoring()
-
-    @pytest.mark.asyncio
-    async def test_host_key_verification_default(self):
+    def test_host_key_verification_default(self):
         """Test that host key verification is enabled by default."""
         config = ServerConfig(
             name="test_server",
@@ -304,273 +303,216 @@ display:
 class TestTextualPilotIntegration:
     """Integration tests using Textual's test harness (pilot) for E2E TUI testing."""
 
-    @pytest.mark.asyncio
-    async def test_app_launches_and_displays(self):
+    async def test_app_launches_and_displays(self, running_app):
         """Test that the MonitoringApp launches successfully."""
-        app = MonitoringApp(server_widgets=[])
-
-        async with app.run_test() as pilot:
-            # Wait for app to mount
-            await pilot.pause()
+        app, pilot = await _show_servers(running_app, [])
 
-            # Verify app is running
-            assert app.is_running
-            assert pilot.app == app
+        # Verify app is running
+        assert app.is_running
+        assert pilot.app == app
 
-    @pytest.mark.asyncio
-    async def test_keyboard_navigation_between_servers(self):
+    async def test_keyboard_navigation_between_servers(self, running_app):
         """Test keyboard navigation using up/down arrows."""
-        # Create widgets before app initialization so they're mounted properly
         server1 = ServerWidget("Server 1")
         server2 = ServerWidget("Server 2")
         server3 = ServerWidget("Server 3")
-        app = MonitoringApp(server_widgets=[server1, server2, server3])
+        app, pilot = await _show_servers(running_app, [server1, server2, server3])
 
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        # Start at index 0
+        assert app.selected_index == 0
 
-            # Start at index 0
-            assert app.selected_index == 0
+        # Navigate down
+        await pilot.press("down")
+        assert app.selected_index == 1
 
-            # Navigate down
-            await pilot.press("down")
-            await pilot.pause()
-            assert app.selected_index == 1
+        # Navigate down again
+        await pilot.press("down")
+        assert app.selected_index == 2
 
-            # Navigate down again
-            await pilot.press("down")
-            await pilot.pause()
-            assert app.selected_index == 2
-
-            # Navigate up
-            await pilot.press("up")
-            await pilot.pause()
-            assert app.selected_index == 1
+        # Navigate up
+        await pilot.press("up")
+        assert app.selected_index == 1
 
-    @pytest.mark.asyncio
-    async def test_expand_collapse_with_arrow_keys(self):
+    async def test_expand_collapse_with_arrow_keys(self, running_app):
         """Test expanding/collapsing server with left/right arrows."""
         server = ServerWidget("Test Server")
-        app = MonitoringApp(server_widgets=[server])
+        app, pilot = await _show_servers(running_app, [server])
+        app.selected_index = 0
 
-        async with app.run_test() as pilot:
-            await pilot.pause()
-            app.selected_index = 0
-
-            # Initially collapsed
-            assert not server.expanded
+        # Initially collapsed
+        assert not server.expanded
 
-            # Press right to expand
-            await pilot.press("right")
-            await pilot.pause()
-            assert server.expanded
+        # Press right to expand
+        await pilot.press("right")
+        assert server.expanded
 
-            # Press left to collapse
-            await pilot.press("left")
-            await pilot.pause()
-            assert not server.expanded
+        # Press left to collapse
+        await pilot.press("left")
+        assert not server.expanded
 
-            # Press Enter to toggle
-            await pilot.press("enter")
-            await pilot.pause()
-            assert server.expanded
+        # Press Enter to toggle
+        await pilot.press("enter")
+        assert server.expanded
 
-    @pytest.mark.asyncio
-    async def test_refresh_action(self):
+    async def test_refresh_action(self, running_app):
         """Test the refresh action (R key)."""
-        app = MonitoringApp(server_widgets=[])
-
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        app, pilot = await _show_servers(running_app, [])
 
-            # Press R to refresh - should not crash
-            await pilot.press("r")
-            await pilot.pause()
+        # Press R to refresh - should not crash
+        await pilot.press("r")
+        await _settle(pilot)
 
-            # Verify app is still running
-            assert app.is_running
+        # Verify app is still running
+        assert app.is_running
 
-    @pytest.mark.asyncio
-    async def test_add_server_dialog_workflow(self):
+    async def test_add_server_dialog_workflow(self, running_app):
         """Test opening and closing Add Server dialog."""
-        app = MonitoringApp(server_widgets=[])
-
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        app, pilot = await _show_servers(running_app, [])
 
-            # Press A to open add server dialog
-            await pilot.press("a")
-            await pilot.pause()
+        # Press A to open add server dialog
+        await pilot.press("a")
+        await _settle(pilot)
 
-            # Verify dialog is in screen stack
-            assert any(isinstance(screen, AddServerScreen) for screen in app.screen_stack)
+        # Verify dialog is the active screen
+        assert isinstance(app.screen, AddServerScreen)
 
-            # Press Escape to cancel
-            await pilot.press("escape")
-            await pilot.pause()
+        # Press Escape to cancel
+        await pilot.press("escape")
+        await _settle(pilot)
 
-    @pytest.mark.asyncio
-    async def test_delete_confirmation_workflow(self):
+    async def test_delete_confirmation_workflow(self, running_app):
         """Test delete server confirmation dialog."""
         server = ServerWidget("Test Server")
-        app = MonitoringApp(server_widgets=[server])
+        app, pilot = await _show_servers(running_app, [server])
 
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        # Press D to delete
+        await pilot.press("d")
+        await _settle(pilot)
 
-            # Press D to delete
-            await pilot.press("d")
-            await pilot.pause()
+        # Verify confirmation dialog appears
+        assert isinstance(app.screen, ConfirmDeleteScreen)
 
-            # Verify confirmation dialog appears
-            assert any(isinstance(screen, ConfirmDeleteScreen) for screen in app.screen_stack)
-
-    @pytest.mark.asyncio
     async def test_quit_application(self):
         """Test quitting with Q key."""
         app = MonitoringApp(server_widgets=[])
 
         async with app.run_test() as pilot:
-            await pilot.pause()
+            await _settle(pilot)
 
             # Press Q to quit
             await pilot.press("q")
-            await pilot.pause()
+            await _settle(pilot)
 
             # App should stop
             assert not app.is_running
 
-    @pytest.mark.asyncio
-    async def test_server_metrics_update_display(self):
+    async def test_server_metrics_update_display(self, running_app):
         """Test that updating metrics refreshes the UI."""
         server = ServerWidget("Test Server")
-        app = MonitoringApp(server_widgets=[server])
-
-        async with app.run_test() as pilot:
-            await pilot.pause()
-
-            # Create test metrics
-            cores = [
-                CPUCore(core_id=0, usage_percent=25.0),
-                CPUCore(core_id=1, usage_percent=50.0),
-                CPUCore(core_id=2, usage_percent=75.0),
-            ]
-
-            metrics = ServerMetrics(
-                server_name="Test Server",
-                timestamp=1234567890.0,
-                cores=cores,
-                overall_usage=50.0,
-                connected=True,
-            )
+        await _show_servers(running_app, [server])
+
+        # Create test metrics
+        cores = [
+            CPUCore(core_id=0, usage_percent=25.0),
+            CPUCore(core_id=1, usage_percent=50.0),
+            CPUCore(core_id=2, usage_percent=75.0),
+        ]
+
+        metrics = ServerMetrics(
+            server_name="Test Server",
+            timestamp=1234567890.0,
+            cores=cores,
+            overall_usage=50.0,
+            connected=True,
+        )
 
-            # Update metrics
-            server.update_metrics(metrics)
-            await pilot.pause()
+        # Update metrics; the fields checked below are set synchronously
+        server.update_metrics(metrics)
 
-            # Verify metrics applied
-            assert server.metrics == metrics
-            assert server.metrics.overall_usage == 50.0
+        # Verify metrics applied
+        assert server.metrics == metrics
+        assert server.metrics.overall_usage == 50.0
 
-    @pytest.mark.asyncio
-    async def test_disconnected_server_error_display(self):
+    async def test_disconnected_server_error_display(self, running_app):
         """Test that disconnected servers show error state in UI."""
         server = ServerWidget("Test Server")
-        app = MonitoringApp(server_widgets=[server])
+        await _show_servers(running_app, [server])
+
+        # Create disconnected metrics
+        metrics = ServerMetrics(
+            server_name="Test Server",
+            timestamp=1234567890.0,
+            cores=[],
+            overall_usage=0.0,
+            connected=False,
+            error_message="Connection timeout",
+        )
 
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        server.update_metrics(metrics)
 
-            # Create disconnected metrics
-            metrics = ServerMetrics(
-                server_name="Test Server",
-                timestamp=1234567890.0,
-                cores=[],
-                overall_usage=0.0,
-                connected=False,
-                error_message="Connection timeout",
-            )
-
-            server.update_metrics(metrics)
-            await pilot.pause()
+        # Verify error state
+        assert not metrics.connected
+        assert metrics.error_message == "Connection timeout"
 
-            # Verify error state
-            assert not metrics.connected
-            assert metrics.error_message == "Connection timeout"
-
-    @pytest.mark.asyncio
-    async def test_command_palette_opens(self):
+    async def test_command_palette_opens(self, running_app):
         """Test command palette (P key)."""
-        app = MonitoringApp(server_widgets=[])
-
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        _, pilot = await _show_servers(running_app, [])
 
-            # Press P for command palette
-            await pilot.press("p")
-            await pilot.pause()
+        # Press P for command palette
+        await pilot.press("p")
+        await _settle(pilot)
 
-            # Textual's built-in command palette should open
+        # Textual's built-in command palette should open
 
-    @pytest.mark.asyncio
-    async def test_navigation_wraps_at_boundaries(self):
+    async def test_navigation_wraps_at_boundaries(self, running_app):
         """Test that navigation does not wrap around at list boundaries."""
         servers = [ServerWidget(f"Server {i}") for i in range(3)]
-        app = MonitoringApp(server_widgets=servers)
+        app, pilot = await _show_servers(running_app, servers)
 
-        async with app.run_test() as pilot:
-            await pilot.pause()
+        # Start at first server
+        assert app.selected_index == 0
 
-            # Start at first server
-            assert app.selected_index == 0
+        # Navigate up from first (should stay at 0, no wrapping)
+        await pilot.press("up")
+        assert app.selected_index == 0  # Stays at 0
 
-            # Navigate up from first (should stay at 0, no wrapping)
-            await pilot.press("up")
-            await pilot.pause()
-            assert app.selected_index == 0  # Stays at 0
+        # Navigate to last
+        await pilot.press("down")
+        await pilot.press("down")
+        assert app.selected_index == 2
 
-            # Navigate to last
-            await pilot.press("down")
-            await pilot.press("down")
-            await pilot.pause()
-            assert app.selected_index == 2
+        # Navigate down from last (should stay at last, no wrapping)
+        await pilot.press("down")
+        assert app.selected_index == 2  # Stays at 2
 
-            # Navigate down from last (should stay at last, no wrapping)
-            await pilot.press("down")
-            await pilot.pause()
-            assert app.selected_index == 2  # Stays at 2
-
-    @pytest.mark.asyncio
-    async def test_cpu_history_accumulates_over_time(self):
+    async def test_cpu_history_accumulates_over_time(self, running_app):
         """Test CPU history accumulation in expanded view."""
         server = ServerWidget("Test Server")
-        app = MonitoringApp(server_widgets=[server])
+        metrics_over_time = [
+            ServerMetrics(
+                server_name="Test Server",
+                timestamp=1234567890.0 + i,
+                cores=[CPUCore(core_id=0, usage_percent=float(i * 10))],
+                overall_usage=float(i * 10),
+                connected=True,
+            )
+            for i in range(10)
+        ]
+        _, pilot = await _show_servers(running_app, [server])
 
-        async with app.run_test() as pilot:
-            await pilot.pause()
-
-            # Expand server
-            server.toggle_expanded()
-            await pilot.pause()
-
-            # Add metrics over time
-            for i in range(10):
-                cores = [CPUCore(core_id=0, usage_percent=float(i * 10))]
-                metrics = ServerMetrics(
-                    server_name="Test Server",
-                    timestamp=1234567890.0 + i,
-                    cores=cores,
-                    overall_usage=float(i * 10),
-                    connected=True,
-                )
-                server.update_metrics(metrics)
-                await pilot.pause(0.05)
-
-            # Verify latest metrics applied
-            assert server.metrics is not None
-            assert server.metrics.overall_usage == 90.0
+        # Expand server
+        server.toggle_expanded()
+        await _settle(pilot)
+
+        # Add metrics over time
+        for metrics in metrics_over_time:
+            server.update_metrics(metrics)
+        await _settle(pilot)
+
+        # Verify latest metrics applied
+        assert server.metrics is not None
+        assert server.metrics.overall_usage == 90.0
 
-    @pytest.mark.asyncio
     async def test_full_user_workflow(self):
         """End-to-end test of typical user workflow."""
         server1 = ServerWidget("Server 1")
@@ -578,68 +520,56 @@ class TestTextualPilotIntegration:
         app = MonitoringApp(server_widgets=[server1, server2])
 
         async with app.run_test() as pilot:
-            await pilot.pause()
+            await _settle(pilot)
 
             # Start at first server
             assert app.selected_index == 0
 
             # Navigate to second server
             await pilot.press("down")
-            await pilot.pause()
             assert app.selected_index == 1
 
             # Expand it
             await pilot.press("right")
-            await pilot.pause()
             assert server2.expanded
 
             # Refresh
             await pilot.press("r")
-            await pilot.pause()
 
             # Collapse
             await pilot.press("left")
-            await pilot.pause()
             assert not server2.expanded
 
             # Navigate back
             await pilot.press("up")
-            await pilot.pause()
             assert app.selected_index == 0
 
             # Quit
             await pilot.press("q")
-            await pilot.pause()
+            await _settle(pilot)
 
-    @pytest.mark.asyncio
-    async def test_concurrent_metric_updates(self):
+    async def test_concurrent_metric_updates(self, running_app):
         """Test multiple servers receiving metrics concurrently."""
         servers = [ServerWidget(f"Server {i}") for i in range(5)]
-        app = MonitoringApp(server_widgets=servers)
+        _, pilot = await _show_servers(running_app, servers)
 
-        async with app.run_test() as pilot:
-            await pilot.pause()
-
-            # Update all servers concurrently
-            async def update_server(server, usage):
-                cores = [CPUCore(core_id=0, usage_percent=usage)]
-                metrics = ServerMetrics(
-                    server_name=server.server_name,
-                    timestamp=1234567890.0,
-                    cores=cores,
-                    overall_usage=usage,
-                    connected=True,
-                )
-                server.update_metrics(metrics)
-
-            # Simulate concurrent updates
-            await asyncio.gather(*[
-                update_server(server, float(i * 20))
-                for i, server in enumerate(servers)
-            ])
-            await pilot.pause()
-
-            # Verify all updated
-            for i, server in enumerate(servers):
-                assert server.metrics is not None
-                assert server.metrics.overall_usage == float(i * 20)
+        metrics_list = [
+            ServerMetrics(
+                server_name=server.server_name,
+                timestamp=1234567890.0,
+                cores=[CPUCore(core_id=0, usage_percent=float(i * 20))],
+                overall_usage=float(i * 20),
+                connected=True,
+            )
+            for i, server in enumerate(servers)
+        ]
+
+        # Apply every update before the app gets a chance to render
+        for server, metrics in zip(servers, metrics_list, strict=True):
+            server.update_metrics(metrics)
+        await _settle(pilot)
+
+        # Verify all updated
+        for i, server in enumerate(servers):
+            assert server.metrics is not None
+            assert server.metrics.overall_usage == float(i * 20)
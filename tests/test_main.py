@@ -2,8 +2,7 @@
 
 import asyncio
 import contextlib
-import tempfile
-from pathlib import Path
+import io
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
@@ -15,56 +14,70 @@ from src.ssh_client import SSHClient
 from src.ui import ServerWidget
 
 
-@pytest.fixture
-def temp_config_file():
-    """Create a temporary config file."""
-    config_data = {
-        "servers": [
-            {
-                "name": "test-server1",
-                "host": "192.168.1.100",
-                "username": "testuser",
-                "auth_method": "key",
-                "key_path": "/tmp/test_key.pem",
-            },
-            {
-                "name": "test-server2",
-                "host": "192.168.1.101",
-                "username": "testuser",
-                "auth_method": "key",
-                "key_path": "/tmp/test_key.pem",
-            },
-        ],
-        "monitoring": {
-            "poll_interval": 2.0,
-            "connection_timeout": 10,
-            "max_retries": 3,
-            "retry_delay": 5,
-            "ui_refresh_interval": 0.5,
+# Same libyaml-backed C implementations src.main prefers, with the same fallback
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+BASE_CONFIG = {
+    "servers": [
+        {
+            "name": "test-server1",
+            "host": "192.168.1.100",
+            "username": "testuser",
+            "auth_method": "key",
+            "key_path": "/tmp/test_key.pem",
         },
-        "display": {
+        {
+            "name": "test-server2",
+            "host": "192.168.1.101",
+            "username": "testuser",
+            "auth_method": "key",
+            "key_path": "/tmp/test_key.pem",
         },
-    }
+    ],
+    "monitoring": {
+        "poll_interval": 2.0,
+        "connection_timeout": 10,
+        "max_retries": 3,
+        "retry_delay": 5,
+        "ui_refresh_interval": 0.5,
+    },
+    "display": {
+    },
+}
+
+# Serialized once at import; fixtures write these bytes instead of re-running the emitter
+BASE_CONFIG_YAML = yaml.dump(BASE_CONFIG, Dumper=YAML_DUMPER).encode()
+
+
+@pytest.fixture(scope="session")
+def base_config_path(tmp_path_factory):
+    """Write the shared test config once; tests must not modify this file."""
+    config_file = tmp_path_factory.mktemp("cfg") / "base.yaml"
+    config_file.write_bytes(BASE_CONFIG_YAML)
+    return str(config_file)
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(config_data, f)
-        temp_path = f.name
 
-    yield temp_path
-
-    # Cleanup
-    Path(temp_path).unlink(missing_ok=True)
+@pytest.fixture
+def temp_config_file(tmp_path):
+    """Write a private copy of the test config for a test that writes to its config file."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_bytes(BASE_CONFIG_YAML)
+    return str(config_file)
 
 
 @pytest.fixture
-def app(temp_config_file):
-    """Create a CPUMonitoringApp instance."""
-    return CPUMonitoringApp(config_path=temp_config_file)
+def app(base_config_path):
+    """Create a CPUMonitoringApp instance reading the shared config.
 
+    Tests that save the config (add, delete, save) build their own app on temp_config_file.
+    """
+    return CPUMonitoringApp(config_path=base_config_path)
 
-def test_app_initialization(app, temp_config_file):
+
+def test_app_initialization(app, base_config_path):
     """Test app initialization."""
-    assert app.config_path == temp_config_file
+    assert app.config_path == base_config_path
     assert app.config == {"servers": [], "monitoring": {}, "display": {}}
     assert app.ssh_clients == []
     assert app.monitors == []
@@ -94,46 +107,59 @@ def test_load_config_file_not_found():
         app.load_config()
 
 
-def test_load_config_invalid_yaml():
+def test_load_config_invalid_yaml(tmp_path):
     """Test loading invalid YAML config."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        f.write("invalid: yaml: content: [")
-        temp_path = f.name
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("invalid: yaml: content: [")
 
-    try:
-        app = CPUMonitoringApp(config_path=temp_path)
-        with pytest.raises(SystemExit):
-            app.load_config()
-    finally:
-        Path(temp_path).unlink(missing_ok=True)
+    app = CPUMonitoringApp(config_path=config_file)
+    with pytest.raises(SystemExit):
+        app.load_config()
 
 
-def test_load_config_missing_servers():
+def test_load_config_missing_servers(tmp_path):
     """Test loading config without servers section."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump({"monitoring": {}}, f)
-        temp_path = f.name
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml.dump({"monitoring": {}}, Dumper=YAML_DUMPER))
 
-    try:
-        app = CPUMonitoringApp(config_path=temp_path)
-        with pytest.raises(SystemExit):
-            app.load_config()
-    finally:
-        Path(temp_path).unlink(missing_ok=True)
+    app = CPUMonitoringApp(config_path=config_file)
+    with pytest.raises(SystemExit):
+        app.load_config()
 
 
-def test_load_config_empty_servers():
+def test_load_config_empty_servers(tmp_path):
     """Test loading config with empty servers list."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump({"servers": []}, f)
-        temp_path = f.name
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml.dump({"servers": []}, Dumper=YAML_DUMPER))
 
-    try:
-        app = CPUMonitoringApp(config_path=temp_path)
-        with pytest.raises(SystemExit):
-            app.load_config()
-    finally:
-        Path(temp_path).unlink(missing_ok=True)
+    app = CPUMonitoringApp(config_path=config_file)
+    with pytest.raises(SystemExit):
+        app.load_config()
+
+
+def test_load_config_reuses_parsed_file(app, base_config_path):
+    """Test that an unchanged file is parsed once and each app gets its own copy."""
+    app.load_config()
+    app.config["servers"].clear()
+
+    other = CPUMonitoringApp(config_path=base_config_path)
+    with patch("src.main.yaml.load") as mock_load:
+        other.load_config()
+
+    mock_load.assert_not_called()
+    assert len(other.config["servers"]) == 2
+
+
+def test_load_config_reparses_modified_file(temp_config_file):
+    """Test that rewriting the config file invalidates the parsed copy."""
+    app = CPUMonitoringApp(config_path=temp_config_file)
+    app.load_config()
+
+    with open(temp_config_file, "w") as f:
+        yaml.dump({"servers": [{**app.config["servers"][0], "name": "only-server"}]}, f, Dumper=YAML_DUMPER)
+    app.load_config()
+
+    assert [server["name"] for server in app.config["servers"]] == ["only-server"]
 
 
 def test_initialize_components(app):
@@ -160,7 +186,7 @@ def test_initialize_components(app):
     assert app.server_widgets[0].server_name == "test-server1"
 
 
-def test_initialize_components_with_defaults(temp_config_file):
+def test_initialize_components_with_defaults(tmp_path):
     """Test initializing components with default configuration values."""
     # Create minimal config
     config_data = {
@@ -175,10 +201,11 @@ def test_initialize_components_with_defaults(temp_config_file):
         ]
     }
 
-    with open(temp_config_file, "w") as f:
-        yaml.dump(config_data, f)
+    config_file = tmp_path / "config.yaml"
+    with open(config_file, "w") as f:
+        yaml.dump(config_data, f, Dumper=YAML_DUMPER)
 
-    app = CPUMonitoringApp(config_path=temp_config_file)
+    app = CPUMonitoringApp(config_path=config_file)
     app.load_config()
     app.initialize_components()
 
@@ -187,28 +214,23 @@ def test_initialize_components_with_defaults(temp_config_file):
     assert app.ssh_clients[0].connection_timeout == 10  # Default
 
 
-def test_initialize_components_missing_field():
-    """Test initializing with missing required field in server config."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        config_data = {
-            "servers": [
-                {
-                    "name": "test-server",
-                    "host": "192.168.1.100",
-                    # Missing username and key_path
-                }
-            ]
-        }
-        yaml.dump(config_data, f)
-        temp_path = f.name
+def test_load_config_missing_server_field(tmp_path):
+    """Test that a server entry missing required fields is rejected at load time."""
+    config_data = {
+        "servers": [
+            {
+                "name": "test-server",
+                "host": "192.168.1.100",
+                # Missing username and key_path
+            }
+        ]
+    }
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text(yaml.dump(config_data, Dumper=YAML_DUMPER))
 
-    try:
-        app = CPUMonitoringApp(config_path=temp_path)
+    app = CPUMonitoringApp(config_path=config_file)
+    with pytest.raises(SystemExit):
         app.load_config()
-        with pytest.raises(SystemExit):
-            app.initialize_components()
-    finally:
-        Path(temp_path).unlink(missing_ok=True)
 
 
 @pytest.mark.asyncio
@@ -281,8 +303,9 @@ async def test_stop_monitoring(app):
     assert app._ui_update_task.cancelled()
 
 
-def test_save_config(app):
+def test_save_config(temp_config_file):
     """Test saving configuration to file."""
+    app = CPUMonitoringApp(config_path=temp_config_file)
     app.load_config()
     app.config["servers"].append({
         "name": "new-server",
@@ -296,7 +319,7 @@ def test_save_config(app):
 
     # Reload and verify
     with open(app.config_path) as f:
-        saved_config = yaml.safe_load(f)
+        saved_config = yaml.load(f, Loader=YAML_LOADER)
 
     assert len(saved_config["servers"]) == 3
     assert saved_config["servers"][2]["name"] == "new-server"
@@ -312,8 +335,40 @@ def test_save_config_error(app, tmp_path):
     app.save_config()
 
 
-def test_delete_server(app):
+def test_load_and_save_config_from_stream(base_config_path):
+    """Test that a config can be read from a stream, which save_config then leaves alone."""
+    with open(base_config_path) as f:
+        app = CPUMonitoringApp(config_path=io.StringIO(f.read()))
+
+    app.load_config()
+    assert [server["name"] for server in app.config["servers"]] == ["test-server1", "test-server2"]
+
+    with patch("builtins.open") as mock_open:
+        app.save_config()
+    mock_open.assert_not_called()
+
+
+def test_from_dict_copies_config():
+    """Test that from_dict validates without reading a file and leaves the caller's dict alone."""
+    config = {"servers": [{"name": "s1", "host": "h1", "username": "u1", "key_path": "/tmp/k"}]}
+
+    with patch("src.main.yaml.load") as mock_load:
+        app = CPUMonitoringApp.from_dict(config)
+    mock_load.assert_not_called()
+
+    app.config["servers"][0]["name"] = "renamed"
+    assert config["servers"][0]["name"] == "s1"
+
+
+def test_from_dict_invalid_config():
+    """Test that from_dict rejects a config load_config would reject."""
+    with pytest.raises(SystemExit):
+        CPUMonitoringApp.from_dict({"servers": []})
+
+
+def test_delete_server(temp_config_file):
     """Test deleting a server."""
+    app = CPUMonitoringApp(config_path=temp_config_file)
     app.load_config()
     app.initialize_components()
 
@@ -336,8 +391,9 @@ def test_delete_server(app):
         mock_create_task.assert_called_once()
 
 
-def test_delete_nonexistent_server(app):
+def test_delete_nonexistent_server(temp_config_file):
     """Test deleting a server that doesn't exist."""
+    app = CPUMonitoringApp(config_path=temp_config_file)
     app.load_config()
     app.initialize_components()
 
@@ -369,8 +425,9 @@ async def test_cleanup_server(app):
     ssh_client.disconnect.assert_called_once()
 
 
-def test_add_server(app):
+def test_add_server(temp_config_file):
     """Test adding a new server."""
+    app = CPUMonitoringApp(config_path=temp_config_file)
     app.load_config()
     app.initialize_components()
 
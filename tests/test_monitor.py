@@ -486,19 +486,17 @@ async def test_history_window_trimming(cpu_monitor):
 
     # Manually add some old history data
     current_time = time.time()
-    cpu_monitor._cpu_history = [
-        (current_time - 100, 50.0),  # Old data outside window
-        (current_time - 50, 45.0),   # Within window
-        (current_time - 10, 55.0),   # Recent
-    ]
+    cpu_monitor._cpu_timestamps = [current_time - 100, current_time - 50, current_time - 10]
+    cpu_monitor._cpu_usages = [50.0, 45.0, 55.0]  # Old (outside window), within window, recent
 
     # Trigger trimming by adding new data
-    cpu_monitor._cpu_history.append((current_time, 60.0))
+    trimmed = cpu_monitor._record_history(current_time, 60.0)
     cutoff_time = current_time - cpu_monitor.history_window
-    cpu_monitor._cpu_history = [(t, u) for t, u in cpu_monitor._cpu_history if t >= cutoff_time]
 
     # Check that old data was trimmed
+    assert trimmed == 1
     history = await cpu_monitor.get_cpu_history()
+    assert history == [(current_time - 50, 45.0), (current_time - 10, 55.0), (current_time, 60.0)]
     assert all(t >= cutoff_time for t, _ in history)
 
 
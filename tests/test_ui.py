@@ -7,7 +7,7 @@ from textual.widgets import Static
 from src.monitor import CPUCore, MemoryInfo, ServerMetrics
 from src.ui import MonitoringApp, ServerWidget
 from src.ui.screens import AddServerScreen, ConfirmDeleteScreen
-from src.ui.widgets import CPUCoreWidget, HistoryPlotWidget, MemoryWidget
+from src.ui.widgets import CPUCoreWidget, HistoryPlotWidget, MemoryWidget, StatusBar
 
 
 def test_cpu_core_widget_initialization():
@@ -68,6 +68,25 @@ def test_cpu_core_widget_update():
     assert widget.core == core2
 
 
+def test_cpu_core_widget_skips_refresh_for_invisible_changes():
+    """Test that sub-0.1% jitter does not repaint the core widget."""
+    widget = CPUCoreWidget(CPUCore(core_id=0, usage_percent=50.0))
+    widget.refresh = Mock()
+
+    # Same displayed percentage and bar: no repaint
+    widget.watch_usage_percent(50.0, 50.02)
+    widget.refresh.assert_not_called()
+
+    # Displayed percentage changes: repaint
+    widget.watch_usage_percent(50.0, 50.2)
+    widget.refresh.assert_called_once()
+
+    # Bar fill changes even though the rounded percentage does not: repaint
+    widget.refresh.reset_mock()
+    widget.watch_usage_percent(6.66, 6.67)
+    widget.refresh.assert_called_once()
+
+
 def test_server_widget_initialization():
     """Test server widget initialization."""
     widget = ServerWidget(
@@ -124,10 +143,10 @@ def test_server_widget_update_metrics():
         connected=True,
     )
 
-    # Mock the containers and query_one to avoid mounting issues in tests
+    # Mock the containers to avoid mounting issues in tests
     widget.cores_container = None  # Don't try to mount
     widget.header_widget = Static()
-    widget.query_one = Mock(return_value=Mock())  # Mock query_one for cores_content
+    widget.cores_content = Mock()  # Mock container for core widgets
 
     widget.update_metrics(metrics)
 
@@ -156,6 +175,87 @@ def test_server_widget_update_metrics_disconnected():
     assert not widget.metrics.connected
 
 
+def test_server_widget_update_metrics_skips_unchanged_readings():
+    """Test that repeated identical readings skip the child widget updates."""
+    widget = ServerWidget(server_name="test-server")
+    widget.header_widget = Static()
+    widget.cores_content = Mock()
+
+    def make_metrics(usage: float) -> ServerMetrics:
+        return ServerMetrics(
+            server_name="test-server",
+            timestamp=1234567890.0,
+            cores=[CPUCore(core_id=0, usage_percent=usage)],
+            overall_usage=usage,
+            connected=True,
+        )
+
+    widget.update_metrics(make_metrics(0.0))
+    core_widget = widget.core_widgets[0]
+    core_widget.update_core = Mock()
+    widget._update_header = Mock()
+
+    # Same readings: only the stored metrics are replaced
+    repeated = make_metrics(0.0)
+    widget.update_metrics(repeated)
+    assert widget.metrics is repeated
+    core_widget.update_core.assert_not_called()
+    widget._update_header.assert_not_called()
+
+    # Changed readings are applied
+    widget.update_metrics(make_metrics(5.0))
+    core_widget.update_core.assert_called_once()
+    widget._update_header.assert_called_once()
+
+
+def test_server_widget_update_metrics_before_compose_not_skipped_later():
+    """Test that readings applied before the cores container exists are not skipped after it does."""
+    widget = ServerWidget(server_name="test-server")
+    widget.header_widget = Static()
+    metrics = ServerMetrics(
+        server_name="test-server",
+        timestamp=1234567890.0,
+        cores=[CPUCore(core_id=0, usage_percent=25.0)],
+        overall_usage=25.0,
+        connected=True,
+    )
+
+    # No cores container yet, as before compose
+    widget.update_metrics(metrics)
+    assert widget.core_widgets == []
+
+    widget.cores_content = Mock()
+    widget.update_metrics(metrics)
+    assert len(widget.core_widgets) == 1
+    widget.cores_content.mount_all.assert_called_once()
+
+
+def test_server_widget_header_text():
+    """Test header markup for selection, expansion and connection state."""
+    widget = ServerWidget(server_name="test-server")
+    widget.header_widget = Mock()
+    widget.metrics = ServerMetrics(
+        server_name="test-server",
+        timestamp=1234567890.0,
+        cores=[CPUCore(core_id=0, usage_percent=42.0)],
+        overall_usage=42.0,
+        connected=True,
+    )
+
+    widget._update_header()
+    widget.header_widget.update.assert_called_with(
+        "  ▶ test-server: [dodger_blue2]✓  42.0% avg (1 cores)[/dodger_blue2]"
+    )
+
+    widget.is_selected = True
+    widget.expanded = True
+    widget.header_widget.update.reset_mock()
+    widget._update_header()
+    widget.header_widget.update.assert_called_with(
+        "[bold]→ ▼ test-server: [dodger_blue2]✓  42.0% avg (1 cores)[/dodger_blue2][/bold]"
+    )
+
+
 def test_server_metrics_core_count():
     """Test ServerMetrics core_count property."""
     cores = [
@@ -494,6 +594,25 @@ def test_monitoring_app_action_refresh():
         widget.refresh_display.assert_called_once()
 
 
+def test_monitoring_app_animate_spinners_only_disconnected():
+    """Test that the shared spinner timer only advances servers that are not connected."""
+    connected = ServerWidget(server_name="server1")
+    connected.metrics = ServerMetrics(
+        server_name="server1", timestamp=0.0, cores=[], overall_usage=0.0, connected=True
+    )
+    pending = ServerWidget(server_name="server2")
+    for widget in (connected, pending):
+        widget.set_spinner_frame = Mock()
+
+    app = MonitoringApp(server_widgets=[connected, pending])
+
+    app._animate_spinners()
+    app._animate_spinners()
+
+    connected.set_spinner_frame.assert_not_called()
+    assert [c.args for c in pending.set_spinner_frame.call_args_list] == [(1,), (2,)]
+
+
 def test_monitoring_app_action_delete_server_no_servers():
     """Test MonitoringApp delete server with no servers."""
 
@@ -666,7 +785,7 @@ def test_server_widget_remove_excess_core_widgets():
     widget.cores_container = None  # Don't mount
     widget.header_widget = Static()
     mock_container = Mock()
-    widget.query_one = Mock(return_value=mock_container)
+    widget.cores_content = mock_container
 
     # Start with 4 cores
     cores = [CPUCore(core_id=i, usage_percent=50.0) for i in range(4)]
@@ -691,14 +810,15 @@ def test_server_widget_remove_excess_core_widgets():
         connected=True,
     )
 
-    # Mock remove method on excess widgets
-    for w in widget.core_widgets:
-        w.remove = Mock()
+    mock_container.mount_all.assert_called_once()
+    assert mock_container.mount_all.call_args.args[0] == widget.core_widgets
 
+    excess = widget.core_widgets[2:]
     widget.update_metrics(metrics)
 
     # Should have removed excess widgets
     assert len(widget.core_widgets) == 2
+    mock_container.remove_children.assert_called_once_with(excess)
 
 
 def test_monitoring_app_action_toggle_expand_invalid_index():
@@ -776,6 +896,9 @@ def test_memory_widget_render_low_usage():
     # Memory label is now in section header, not in widget render
     assert "25.0%" in rendered
     assert "[dodger_blue2]" in rendered  # Should be blue
+    # GB figures are derived once on the MemoryInfo record
+    assert memory_info.used_gb == 4000.0 / 1024
+    assert "(3.9/15.6 GB)" in rendered
 
 
 def test_memory_widget_render_medium_usage():
@@ -903,6 +1026,66 @@ def test_server_widget_update_history():
     widget.update_history(history_data)
 
 
+def test_history_plot_widget_render_bar_columns():
+    """Test that each value renders as full rows plus an optional half block."""
+    widget = HistoryPlotWidget(history_window=8, poll_interval=2.0)
+    widget.update_history([(0.0, 0.0), (2.0, 55.0), (4.0, 100.0), (6.0, 10.0)])
+
+    rows = [line.split("│")[1] for line in widget.render().split("\n")[: widget.PLOT_HEIGHT]]
+    columns = ["".join(row[len("[dodger_blue2]") + i] for row in rows) for i in range(4)]
+
+    assert columns[0] == " " * 10
+    assert columns[1] == " " * 4 + "▄" + "█" * 5
+    assert columns[2] == "█" * 10
+    assert columns[3] == " " * 9 + "█"
+
+
+def test_history_plot_widget_sliding_window_updates():
+    """Test that successive polls slide the window and short histories are zero-padded."""
+    widget = HistoryPlotWidget(history_window=8, poll_interval=2.0)
+    history = [(float(t), float(t)) for t in range(0, 10, 2)]
+
+    widget.update_history(history[:2])
+    assert list(widget.data) == [0.0, 0.0, 0.0, 2.0]
+
+    widget.update_history(history)
+    assert list(widget.data) == [2.0, 4.0, 6.0, 8.0]
+
+    # Next poll: oldest sample trimmed, one new sample appended
+    history = [*history[1:], (10.0, 10.0)]
+    widget.update_history(history)
+    assert list(widget.data) == [4.0, 6.0, 8.0, 10.0]
+    # Displayed values are kept quantized to one column code byte each
+    assert widget._codes == bytearray([1, 1, 1, 2])
+
+    # History restarted (e.g. after reconnect): display is rebuilt from scratch
+    widget.update_history([(100.0, 50.0)])
+    assert list(widget.data) == [0.0, 0.0, 0.0, 50.0]
+    assert widget._codes == bytearray([0, 0, 0, 10])
+
+
+def test_history_plot_widget_skips_refresh_when_columns_unchanged():
+    """Test that updates which leave every drawn column the same do not repaint."""
+    widget = HistoryPlotWidget(history_window=8, poll_interval=2.0)
+    widget.refresh = Mock()
+
+    # Idle samples draw the same empty columns as the initial padding
+    widget.update_history([(0.0, 0.0), (2.0, 0.0)])
+    widget.refresh.assert_not_called()
+
+    history = [(0.0, 0.0), (2.0, 0.0), (4.0, 50.0), (6.0, 50.0)]
+    widget.update_history(history)
+    assert widget.refresh.call_count == 1
+
+    # Same history again: no new samples
+    widget.update_history(history)
+    assert widget.refresh.call_count == 1
+
+    # New sample scrolls the window, so the chart changes
+    widget.update_history([*history[1:], (8.0, 50.0)])
+    assert widget.refresh.call_count == 2
+
+
 # Tests for Sparkline-based visualization
 def test_history_plot_widget_sparkline_data():
     """Test Sparkline data handling."""
@@ -940,3 +1123,39 @@ def test_history_plot_widget_sparkline_style():
     # Check that history data is stored
     assert widget.history_data == history_data
     assert widget.history_window == 60
+
+
+def test_status_bar_update_time_formatted_once_per_second():
+    """Test that the update time is reformatted only when the second changes."""
+    widget = StatusBar()
+
+    widget.update_stats(total=1, connected=1, average_cpu=10.0, last_update_time=3600.2)
+    assert widget.last_update == "01:00:00"
+    formatted = widget._last_update_str
+
+    widget.update_stats(total=1, connected=1, average_cpu=10.0, last_update_time=3600.9)
+    assert widget._last_update_str is formatted
+
+    widget.update_stats(total=1, connected=1, average_cpu=10.0, last_update_time=3601.0)
+    assert widget.last_update == "01:00:01"
+
+    widget.update_stats(total=1, connected=1, average_cpu=10.0)
+    assert widget.last_update == "--:--:--"
+
+
+def test_status_bar_skips_identical_updates():
+    """Test that the status text is only rebuilt when the displayed stats change."""
+    widget = StatusBar()
+    widget.refresh_display = Mock()
+
+    widget.update_stats(total=2, connected=1, average_cpu=12.34, last_update_time=100.0)
+    widget.update_stats(total=2, connected=1, average_cpu=12.31, last_update_time=100.5)
+    assert widget.refresh_display.call_count == 1
+
+    widget.update_stats(total=2, connected=2, average_cpu=12.31, last_update_time=100.5)
+    assert widget.refresh_display.call_count == 2
+
+    # Same rounded value, but across the colour threshold
+    widget.update_stats(total=2, connected=2, average_cpu=29.96, last_update_time=100.5)
+    widget.update_stats(total=2, connected=2, average_cpu=30.0, last_update_time=100.5)
+    assert widget.refresh_display.call_count == 4
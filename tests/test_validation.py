@@ -4,6 +4,7 @@
 from src.validation import (
     validate_hostname,
     validate_port,
+    validate_server_config,
     validate_server_name,
     validate_username,
 )
@@ -56,6 +57,12 @@ class TestValidateHostname:
         result = validate_hostname("invalid-.com")
         assert not result.valid
 
+    def test_inner_label_hyphens(self):
+        """Test hyphens at the edges of inner labels versus inside a label."""
+        assert not validate_hostname("web.-inner.example.com").valid
+        assert not validate_hostname("web.inner-.example.com").valid
+        assert validate_hostname("web.in-ner.example.com").valid
+
     def test_invalid_special_characters(self):
         """Test hostname with invalid characters."""
         result = validate_hostname("invalid_host.com")
@@ -139,6 +146,13 @@ class TestValidateServerName:
         assert not result.valid
         assert "control" in result.error_message.lower()
 
+    def test_control_character_boundary(self):
+        """Test that only code points below 32 count as control characters."""
+        assert not validate_server_name("server\x1fname").valid
+        assert not validate_server_name("server\tname").valid
+        assert validate_server_name("server\x7fname").valid
+        assert validate_server_name("sérvér ★").valid
+
     def test_whitespace_handling(self):
         """Test that whitespace is handled correctly."""
         result = validate_server_name("   server   ")
@@ -181,3 +195,51 @@ class TestValidatePort:
         result = validate_port("abc")
         assert not result.valid
         assert "number" in result.error_message.lower()
+
+    def test_valid_results_are_shared(self):
+        """Test that successful validations return the same immutable result."""
+        assert validate_port(22) is validate_port("8080")
+        assert validate_port(22) is validate_hostname("example.com")
+        assert validate_port(22) == (True, None)
+
+
+class TestValidateServerConfig:
+    """Tests for config file server entry validation."""
+
+    def test_valid_key_auth(self):
+        """Test a complete key-auth entry, with auth_method defaulting to key."""
+        server = {"name": "srv", "host": "example.com", "username": "user", "key_path": "~/.ssh/id_rsa"}
+        assert validate_server_config(server).valid
+        assert validate_server_config({**server, "auth_method": "key"}).valid
+
+    def test_valid_password_auth(self):
+        """Test that password auth does not need a key_path."""
+        server = {"name": "srv", "host": "example.com", "username": "user", "auth_method": "password"}
+        assert validate_server_config(server).valid
+
+    def test_invalid_not_a_mapping(self):
+        """Test a server entry that is not a mapping."""
+        result = validate_server_config("srv")
+        assert not result.valid
+        assert "mapping" in result.error_message
+
+    def test_invalid_missing_fields(self):
+        """Test that all missing required fields are reported."""
+        result = validate_server_config({"name": "srv", "auth_method": "password"})
+        assert not result.valid
+        assert "host" in result.error_message
+        assert "username" in result.error_message
+
+    def test_invalid_auth_method(self):
+        """Test an unsupported auth method."""
+        server = {"name": "srv", "host": "example.com", "username": "user", "auth_method": "token"}
+        result = validate_server_config(server)
+        assert not result.valid
+        assert "auth_method" in result.error_message
+
+    def test_invalid_key_auth_without_key_path(self):
+        """Test key auth without a key_path."""
+        server = {"name": "srv", "host": "example.com", "username": "user", "auth_method": "key"}
+        result = validate_server_config(server)
+        assert not result.valid
+        assert "key_path" in result.error_message